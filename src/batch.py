@@ -0,0 +1,226 @@
+import argparse
+import base64
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+
+from controller.headless import GENERATORS, build_maze
+from model.algorithms import solve_maze_bfs, solve_maze_astar
+from model.analytics import analyze_maze
+from model.rng import spawn_seeds
+from model.solvers import (
+    prune_dead_ends, solve_maze_bidirectional_astar, solve_maze_bidirectional_bfs
+)
+from model.tree_index import build_tree_index, solve_maze_indexed
+
+# Generadores de controller.headless, con sus nombres en minúsculas para la CLI
+ALGORITHMS = sorted(name.lower() for name in GENERATORS)
+
+
+def solve_maze_tree(graph, start, end):
+    """Camino por índice de árbol si el laberinto es perfecto; si no, BFS."""
+    return solve_maze_indexed(graph, start, end, build_tree_index(graph))
+
+
+SOLVERS = {
+    "bfs": solve_maze_bfs,
+    "astar": solve_maze_astar,
+    "bibfs": solve_maze_bidirectional_bfs,
+    "biastar": solve_maze_bidirectional_astar,
+    "indexed": solve_maze_tree,
+}
+
+
+def run_job(job):
+    """
+    Genera (y opcionalmente resuelve) un laberinto y lo guarda en disco.
+
+    Se ejecuta dentro de un proceso del pool, por eso recibe y retorna
+    únicamente diccionarios serializables.
+    """
+    started = time.perf_counter()
+    graph = build_maze(job["width"], job["height"], job["algorithm"], job["seed"],
+                       ratio=job["ratio"], tile=job["tile"], workers=job["workers"])
+
+    record = {
+        "width": graph.width,
+        "height": graph.height,
+        "algorithm": job["algorithm"],
+        "ratio": job["ratio"],
+        "seed": job["seed"],
+        "entry": graph.entry,
+        "exit": graph.exit,
+    }
+
+    if job["solver"]:
+        search_graph = graph
+        if job["prune"]:
+            search_graph = prune_dead_ends(graph, graph.entry, graph.exit)
+        path, visited = SOLVERS[job["solver"]](search_graph, graph.entry, graph.exit)
+        record["solver"] = job["solver"]
+        record["path"] = path
+        record["explored"] = len(visited)
+
+    if job["analyze"]:
+        record["metrics"] = analyze_maze(graph)
+
+    base = os.path.join(job["output"], f"maze_{job['seed']}")
+    if job["png"]:
+        # Importación diferida: solo los trabajos que exportan imagen la pagan
+        from view.raster import render_maze, save_png
+
+        image = render_maze(graph, job["png"], path=record.get("path"))
+        save_png(image, base + ".png")
+
+    if job["format"] == "maze":
+        # Importación diferida: el formato .maze trae NumPy
+        from model.maze_file import save_maze
+
+        filename = base + ".maze"
+        save_maze(graph, filename, seed=job["seed"], algorithm=job["algorithm"])
+        if job["solver"]:
+            # La solución va en un archivo JSON aparte del mapa de paredes
+            with open(base + ".solution.json", "w", encoding="utf-8") as file:
+                json.dump(record, file)
+    else:
+        filename = base + ".json"
+        record["passages"] = base64.b64encode(bytes(graph.passages)).decode("ascii")
+        with open(filename, "w", encoding="utf-8") as file:
+            json.dump(record, file)
+
+    return {
+        "seed": job["seed"],
+        "file": filename,
+        "path_length": len(record["path"]) - 1 if record.get("path") else None,
+        "metrics": record.get("metrics"),
+        "seconds": time.perf_counter() - started,
+    }
+
+
+# Las semillas se guardan como enteros sin signo de 64 bits en el formato .maze
+SEED_LIMIT = 2 ** 64
+
+
+def _at_least(minimum):
+    """Tipo de argparse para enteros mayores o iguales a ``minimum``."""
+
+    def check(text):
+        value = int(text)
+        if value < minimum:
+            raise argparse.ArgumentTypeError(f"debe ser al menos {minimum} (recibido: {value})")
+        return value
+
+    check.__name__ = "int"  # argparse lo muestra en "invalid int value"
+    return check
+
+
+# Ancho, alto y lado de las teselas: al menos 2 celdas
+_dimension = _at_least(2)
+
+
+def _seed(text):
+    """Tipo de argparse para semillas: entero en [0, 2**64)."""
+    value = int(text)
+    if not 0 <= value < SEED_LIMIT:
+        raise argparse.ArgumentTypeError(f"debe estar entre 0 y 2**64 - 1 (recibido: {value})")
+    return value
+
+
+def parse_args(argv=None):
+    """Define los argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        description="Genera laberintos en lote sin interfaz gráfica."
+    )
+    parser.add_argument("--width", type=_dimension, default=25, help="ancho en celdas (mínimo 2)")
+    parser.add_argument("--height", type=_dimension, default=25, help="alto en celdas (mínimo 2)")
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default="dfs")
+    parser.add_argument("--ratio", type=float, default=0.3, help="proporción de pasajes extra")
+    parser.add_argument("--count", type=_at_least(1), default=1, help="cantidad de laberintos")
+    parser.add_argument("--seed", type=_seed, default=0,
+                        help="primera semilla; se usan seed .. seed + count - 1")
+    parser.add_argument("--spawn-from", type=int, default=None,
+                        help="derivar semillas independientes de esta semilla base")
+    parser.add_argument("--solve", choices=sorted(SOLVERS), default=None,
+                        help="resolver cada laberinto con este algoritmo")
+    parser.add_argument("--prune", action="store_true",
+                        help="rellenar callejones sin salida antes de resolver")
+    parser.add_argument("--analyze", action="store_true",
+                        help="agregar métricas de dificultad (callejones, diámetro...)")
+    parser.add_argument("--output", default="mazes", help="directorio de salida")
+    parser.add_argument("--format", choices=["json", "maze"], default="json",
+                        help="json (pasajes en base64) o binario .maze")
+    parser.add_argument("--png", type=_at_least(0), default=0, metavar="PIXELES",
+                        help="exportar también un PNG con celdas de este tamaño")
+    parser.add_argument("--tile", type=_dimension, default=None, metavar="CELDAS",
+                        help="generar cada laberinto por teselas de este lado en paralelo "
+                             "(para laberintos gigantes; solo dfs y kruskal)")
+    parser.add_argument("--workers", type=_at_least(1), default=None,
+                        help="procesos del pool (por defecto, todos los núcleos)")
+    args = parser.parse_args(argv)
+    if args.spawn_from is None and args.seed + args.count > SEED_LIMIT:
+        parser.error("--seed + --count - 1 debe ser menor que 2**64")
+    return args
+
+
+def main(argv=None):
+    """Reparte la generación de laberintos entre todos los núcleos."""
+    args = parse_args(argv)
+    os.makedirs(args.output, exist_ok=True)
+
+    if args.spawn_from is not None:
+        seeds = spawn_seeds(args.spawn_from, args.count)
+    else:
+        seeds = range(args.seed, args.seed + args.count)
+
+    jobs = [
+        {
+            "width": args.width,
+            "height": args.height,
+            "algorithm": args.algorithm,
+            "ratio": args.ratio,
+            "seed": seed,
+            "solver": args.solve,
+            "prune": args.prune,
+            "analyze": args.analyze,
+            "output": args.output,
+            "format": args.format,
+            "png": args.png,
+            "tile": args.tile,
+            "workers": args.workers,
+        }
+        for seed in seeds
+    ]
+
+    workers = args.workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 4))
+    started = time.perf_counter()
+
+    with ExitStack() as stack:
+        if args.tile:
+            from model.tiled import TILE_ALGORITHMS
+
+            if args.algorithm not in TILE_ALGORITHMS:
+                sys.exit(f"--tile solo admite: {', '.join(TILE_ALGORITHMS)}")
+            # Un laberinto a la vez: el paralelismo está dentro de cada uno
+            results = map(run_job, jobs)
+        else:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            results = executor.map(run_job, jobs, chunksize=chunksize)
+
+        for result in results:
+            length = result["path_length"]
+            solved = f" | camino {length}" if length is not None else ""
+            metrics = result["metrics"]
+            if metrics:
+                solved += (f" | {metrics['dead_ends']} callejones"
+                           f" | diámetro {metrics['diameter']}")
+            print(f"semilla {result['seed']}: {result['file']} ({result['seconds']:.3f}s){solved}")
+
+    print(f"{len(jobs)} laberintos en {time.perf_counter() - started:.2f}s con {workers} procesos")
+
+
+if __name__ == "__main__":
+    main()
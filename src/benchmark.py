@@ -0,0 +1,302 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from model.algorithms import (
+    add_extra_passages, carve_maze_dfs, generate_maze_dfs,
+    solve_maze_astar, solve_maze_bfs
+)
+from model.graph import GridGraph
+
+DEFAULT_SIZES = [25, 100, 500, 1000, 2000]
+# Presupuesto de importación del camino sin ventana, en milisegundos
+IMPORT_BUDGET_MS = 50
+HEADLESS_MODULE = "controller.headless"
+GUI_MODULES = ("tkinter", "_tkinter", "customtkinter")
+# Un caso es más lento que la línea base si tarda más de (1 + umbral) veces
+DEFAULT_THRESHOLD = 0.2
+
+
+class RecordingCanvas:
+    """Canvas falso que solo cuenta los ítems creados (sin Tk)."""
+
+    def __init__(self):
+        self.items = 0
+
+    def _create(self, *args, **kwargs):
+        self.items += 1
+        return self.items
+
+    create_line = create_oval = create_rectangle = create_image = create_text = _create
+
+    def __getattr__(self, name):
+        # delete, configure, tag_raise... no hacen nada
+        return lambda *args, **kwargs: None
+
+
+def _maze(size, seed):
+    graph = GridGraph(size, size)
+    generate_maze_dfs(graph, rng=seed)
+    return graph
+
+
+def _case_generate_dfs(size, seed):
+    graph = GridGraph(size, size)
+    return lambda: generate_maze_dfs(graph, rng=seed)
+
+
+def _case_generate_kruskal(size, seed):
+    """Kruskal vectorizado, el que usan la interfaz y el modo por lotes."""
+    # Importación diferida: el Kruskal vectorizado trae NumPy
+    from model.vectorized import generate_maze_kruskal_vectorized
+
+    graph = GridGraph(size, size)
+    return lambda: generate_maze_kruskal_vectorized(graph, rng=seed)
+
+
+def _case_generate_tiled(size, seed):
+    """Generación por teselas con todos los núcleos (ver ``model.tiled``)."""
+    # Importación diferida: el modo por teselas trae NumPy
+    from model.tiled import generate_maze_tiled
+
+    graph = GridGraph(size, size)
+
+    def run():
+        generate_maze_tiled(graph, rng=seed)
+    return run
+
+
+def _case_extra_passages(size, seed):
+    graph = GridGraph(size, size)
+    carve_maze_dfs(graph, rng=seed)
+    return lambda: add_extra_passages(graph, 0.3, rng=seed)
+
+
+def _solver_case(solver):
+    def case(size, seed):
+        graph = _maze(size, seed)
+
+        def run():
+            path, visited = solver(graph, graph.entry, graph.exit)
+            return {"explored": len(visited), "path_length": len(path) - 1}
+        return run
+    return case
+
+
+def _case_draw_maze(size, seed):
+    """Tiempo de creación de ítems de ``MazeView.draw_maze`` sobre un canvas falso."""
+    # Importación diferida: la vista requiere customtkinter
+    from view.maze_view import MazeView
+
+    graph = _maze(size, seed)
+    view = MazeView.__new__(MazeView)
+    view.cell_size = 25
+    view.margin = 15
+    view.raster_threshold = float("inf")  # medir siempre el dibujo vectorial
+    view.viewport = SimpleNamespace(enabled=False)
+    view.animator = SimpleNamespace(cancel=lambda: None)
+
+    def run():
+        view.canvas = RecordingCanvas()
+        view.draw_maze(graph)
+        return {"items": view.canvas.items}
+    return run
+
+
+# Cada caso recibe (lado, semilla), prepara lo necesario fuera de la
+# medición y retorna la función a medir (que puede retornar métricas extra).
+CASES = {
+    "generate_dfs": _case_generate_dfs,
+    "generate_kruskal": _case_generate_kruskal,
+    "generate_tiled": _case_generate_tiled,
+    "add_extra_passages": _case_extra_passages,
+    "solve_bfs": _solver_case(solve_maze_bfs),
+    "solve_astar": _solver_case(solve_maze_astar),
+    "draw_maze": _case_draw_maze,
+}
+
+
+def measure(case, size, seed, repeat=3, memory=True):
+    """
+    Mide un caso para un tamaño.
+
+    El tiempo es el mínimo de ``repeat`` corridas sin ``tracemalloc`` (que
+    ralentiza la ejecución); el pico de memoria sale de una corrida aparte.
+    Cada corrida se prepara desde cero para no medir un laberinto ya tallado.
+    """
+    times = []
+    extra = {}
+    for _ in range(repeat):
+        run = CASES[case](size, seed)
+        started = time.perf_counter()
+        extra = run() or {}
+        times.append(time.perf_counter() - started)
+
+    result = {
+        "case": case,
+        "width": size,
+        "height": size,
+        "cells": size * size,
+        "seconds": min(times),
+        "median_seconds": statistics.median(times),
+        **extra,
+    }
+
+    if memory:
+        run = CASES[case](size, seed)
+        tracemalloc.start()
+        try:
+            run()
+            result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def measure_import(module=HEADLESS_MODULE, repeat=5):
+    """
+    Mide en un intérprete nuevo cuánto tarda ``import module``.
+
+    Retorna el mínimo de ``repeat`` procesos, en milisegundos, y los módulos
+    de interfaz gráfica que la importación haya arrastrado.
+    """
+    script = (
+        "import sys, time\n"
+        "started = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = (time.perf_counter() - started) * 1000\n"
+        f"gui = sorted(m for m in sys.modules if m.split('.')[0] in {GUI_MODULES!r})\n"
+        "print(elapsed, ','.join(gui))\n"
+    )
+    source_dir = os.path.dirname(os.path.abspath(__file__))
+    times = []
+    gui = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", script], check=True, cwd=source_dir,
+                                capture_output=True, text=True).stdout.split()
+        times.append(float(output[0]))
+        gui = output[1].split(",") if len(output) > 1 else []
+    return {"module": module, "milliseconds": min(times), "gui_modules": gui}
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compara resultados con una línea base.
+
+    Retorna una lista de diccionarios con la razón de tiempo y de memoria
+    por caso, y ``regression`` en ``True`` si alguna supera el umbral.
+    """
+    previous = {(r["case"], r["width"], r["height"]): r for r in baseline["results"]}
+    report = []
+    for result in results:
+        before = previous.get((result["case"], result["width"], result["height"]))
+        if before is None:
+            continue
+        row = {
+            "case": result["case"],
+            "width": result["width"],
+            "height": result["height"],
+            "time_ratio": result["seconds"] / max(before["seconds"], 1e-9),
+        }
+        if "peak_bytes" in result and "peak_bytes" in before:
+            row["memory_ratio"] = result["peak_bytes"] / max(before["peak_bytes"], 1)
+        row["regression"] = any(
+            row.get(key, 0) > 1 + threshold for key in ("time_ratio", "memory_ratio")
+        )
+        report.append(row)
+    return report
+
+
+def parse_args(argv=None):
+    """Define los argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        description="Mide generadores, solucionadores y dibujo en varios tamaños."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="lados de las cuadrículas (cuadradas)")
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES),
+                        help="casos a medir")
+    parser.add_argument("--repeat", type=int, default=3, help="corridas por medición")
+    parser.add_argument("--seed", type=int, default=0, help="semilla de los laberintos")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="no medir el pico de memoria con tracemalloc")
+    parser.add_argument("--output", default=None,
+                        help="archivo JSON de resultados (por defecto, salida estándar)")
+    parser.add_argument("--compare", default=None, metavar="BASELINE",
+                        help="comparar con un JSON guardado previamente")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="tolerancia antes de marcar una regresión (0.2 = 20%%)")
+    parser.add_argument("--import-budget", type=float, default=IMPORT_BUDGET_MS,
+                        metavar="MS",
+                        help="máximo para importar el camino sin ventana (controller.headless)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Ejecuta las mediciones. Retorna 1 si la importación sin ventana excede
+    el presupuesto (o carga Tk) o, con ``--compare``, si hay regresiones.
+    """
+    args = parse_args(argv)
+    failed = False
+
+    headless = measure_import()
+    headless["budget_milliseconds"] = args.import_budget
+    print(f"import {headless['module']}: {headless['milliseconds']:.1f} ms "
+          f"(presupuesto {args.import_budget:g} ms)", file=sys.stderr)
+    if headless["gui_modules"]:
+        print(f"  carga módulos de interfaz: {', '.join(headless['gui_modules'])}",
+              file=sys.stderr)
+    if headless["milliseconds"] > args.import_budget or headless["gui_modules"]:
+        print("  <-- FUERA DE PRESUPUESTO", file=sys.stderr)
+        failed = True
+
+    results = []
+    for case in args.cases:
+        for size in args.sizes:
+            try:
+                result = measure(case, size, args.seed, args.repeat, not args.no_memory)
+            except ImportError as error:
+                print(f"{case}: omitido ({error})", file=sys.stderr)
+                break
+            results.append(result)
+            print(f"{case} {size}x{size}: {result['seconds']:.4f}s", file=sys.stderr)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "headless_import": headless,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        rows = compare(results, baseline, args.threshold)
+        for row in rows:
+            memory = f" | memoria x{row['memory_ratio']:.2f}" if "memory_ratio" in row else ""
+            flag = "  <-- REGRESIÓN" if row["regression"] else ""
+            print(f"{row['case']} {row['width']}x{row['height']}: "
+                  f"tiempo x{row['time_ratio']:.2f}{memory}{flag}", file=sys.stderr)
+        if any(row["regression"] for row in rows):
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Configuración de pytest: los tests importan los módulos desde ``src``."""
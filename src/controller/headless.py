@@ -0,0 +1,321 @@
+import random
+
+from model.algorithms import (
+    PROGRESS_INTERVAL, generate_maze_dfs,
+    iter_solve_astar, iter_solve_bfs
+)
+from model.analytics import analyze_maze
+from model.dynamic import DynamicSolver, toggle_wall
+from model.eller import generate_maze_eller
+from model.graph import GridGraph
+from model.instrumentation import Instrumentation, measure
+from model.rng import spawn_seeds
+from model.solution_cache import SolutionCache, maze_fingerprint
+from model.weighted import generate_terrain, iter_solve_dijkstra, iter_solve_weighted_astar
+
+# Este módulo no debe importar tkinter, customtkinter ni la vista: lo usan
+# procesos sin ventana que se lanzan a menudo. El formato .maze (que trae
+# NumPy) también se importa recién al guardar o cargar, y el Kruskal
+# vectorizado recién al generar con él.
+
+
+def generate_maze_kruskal(graph, ratio=0.3, rng=None, progress=None, instrumentation=None):
+    """Kruskal vectorizado (``model.vectorized``) importado al primer uso."""
+    from model.vectorized import generate_maze_kruskal_vectorized
+
+    generate_maze_kruskal_vectorized(graph, ratio, rng, progress, instrumentation)
+
+
+GENERATORS = {
+    "DFS": generate_maze_dfs,
+    "Eller": generate_maze_eller,
+    "Kruskal": generate_maze_kruskal,
+}
+
+# clave -> (búsqueda incremental, nombre para mostrar)
+SOLVERS = {
+    "BFS": (iter_solve_bfs, "BFS"),
+    "ASTAR": (iter_solve_astar, "A*"),
+    "DIJKSTRA": (iter_solve_dijkstra, "Dijkstra"),
+    "WASTAR": (iter_solve_weighted_astar, "A* ponderado"),
+}
+# Algoritmos cuya solución se repara con costos de terreno tras editar paredes
+WEIGHTED_SOLVERS = ("DIJKSTRA", "WASTAR")
+
+
+def generator_name(algorithm):
+    """
+    Nombre de ``GENERATORS`` para ``algorithm`` sin distinguir mayúsculas
+    (``"dfs"`` y ``"DFS"`` son el mismo). Lanza ``ValueError`` si no existe.
+    """
+    for name in GENERATORS:
+        if name.lower() == algorithm.lower():
+            return name
+    raise ValueError(f"Algoritmo '{algorithm}' no soportado.")
+
+
+def build_maze(width, height, algorithm, seed, progress=None, instrumentation=None,
+               terrain=False, ratio=None, tile=None, workers=None):
+    """
+    Genera un laberinto nuevo sin tocar ningún estado compartido.
+
+    ``ratio`` es la proporción de pasajes extra (por defecto, la de cada
+    algoritmo). Con ``tile`` se genera por teselas en ``workers`` procesos
+    (ver ``model.tiled``; solo DFS y Kruskal). Con ``terrain`` se agregan
+    costos por celda, sorteados con una semilla derivada de ``seed`` (las
+    paredes son las mismas que sin terreno). Puede ejecutarse en un hilo o
+    proceso aparte. Lanza ``ValueError`` si el algoritmo no existe.
+    """
+    name = generator_name(algorithm)
+    options = {} if ratio is None else {"ratio": ratio}
+    graph = GridGraph(width, height)
+    if tile:
+        # Importación diferida: el modo por teselas trae NumPy
+        from model.tiled import TILE_ALGORITHMS, generate_maze_tiled
+
+        if name.lower() not in TILE_ALGORITHMS:
+            raise ValueError(f"Algoritmo '{name}' no soportado por teselas.")
+        generate_maze_tiled(graph, tile, rng=seed, workers=workers,
+                            algorithm=name.lower(), progress=progress, **options)
+    else:
+        GENERATORS[name](graph, rng=seed, progress=progress,
+                         instrumentation=instrumentation, **options)
+    if terrain:
+        generate_terrain(graph, rng=spawn_seeds(seed, 1)[0])
+    return graph
+
+
+def solve_in_order(search, graph, start, end, progress=None, instrumentation=None,
+                   algorithm=""):
+    """
+    Ejecuta una búsqueda incremental y retorna ``(path, visited)`` con los
+    visitados como lista en el orden real de expansión.
+    """
+    with measure(instrumentation, "solve", algorithm=algorithm) as record:
+        steps = search(graph, start, end, batch_size=PROGRESS_INTERVAL, stats=record)
+        order = []
+        while True:
+            try:
+                order.extend(next(steps))
+            except StopIteration as stop:
+                return stop.value[0], order
+            if progress is not None:
+                progress(len(order))
+
+
+class MazeSession:
+    """
+    Lógica del controlador sin interfaz gráfica.
+
+    Mantiene el laberinto actual con su semilla, algoritmo y huella, la caché
+    de soluciones y las mediciones. ``MazeController`` la usa detrás de la
+    ventana; los procesos por lotes y los scripts la usan directamente. Los
+    errores se informan con ``ValueError`` en lugar de cuadros de diálogo.
+    """
+
+    def __init__(self, cache_size=32):
+        """Crea una sesión sin laberinto."""
+        self.graph = None
+        self.seed = None
+        self.algorithm = None
+        self.fingerprint = None
+        self.dynamic = None
+        self._tree_index = None
+        self._tree_checked = False
+        self.solution_cache = SolutionCache(cache_size)
+        self.instrumentation = Instrumentation()
+
+    def set_graph(self, graph, seed=None, algorithm=None):
+        """Reemplaza el laberinto actual e invalida las soluciones del anterior."""
+        if self.fingerprint is not None:
+            self.solution_cache.invalidate(self.fingerprint)
+        self.graph = graph
+        self.seed = seed
+        self.algorithm = algorithm
+        self.fingerprint = maze_fingerprint(graph) if graph is not None else None
+        self.dynamic = None
+        self._drop_tree_index()
+
+    def generate(self, width, height, algorithm="DFS", seed=None, progress=None,
+                 terrain=False):
+        """
+        Genera un laberinto y lo deja como actual.
+
+        Si no se indica ``seed`` se sortea una; queda en ``self.seed``. Con
+        ``terrain`` el laberinto tiene costos por celda (ver ``build_maze``).
+        """
+        if seed is None:
+            seed = random.randrange(2 ** 63)
+        graph = build_maze(width, height, algorithm, seed, progress, self.instrumentation,
+                           terrain)
+        self.set_graph(graph, seed, algorithm)
+        return graph
+
+    def load(self, path):
+        """Carga un laberinto .maze en memoria y lo deja como actual."""
+        from model.maze_file import load_maze
+
+        with load_maze(path) as maze:
+            graph = maze.to_grid_graph()
+            self.set_graph(graph, maze.seed, maze.algorithm)
+        return graph
+
+    def save(self, path):
+        """Guarda el laberinto actual en formato binario .maze (sin el terreno)."""
+        from model.maze_file import save_maze
+
+        self._require_graph()
+        save_maze(self.graph, path, seed=self.seed, algorithm=self.algorithm or "")
+
+    def _require_graph(self):
+        if not self.graph:
+            raise ValueError("Primero debes generar un laberinto.")
+
+    def endpoints(self):
+        """Entrada y salida del laberinto actual; ``ValueError`` si faltan."""
+        self._require_graph()
+        if not self.graph.entry or not self.graph.exit:
+            raise ValueError("El laberinto no tiene puntos de entrada o salida.")
+        return self.graph.entry, self.graph.exit
+
+    def solver(self, algorithm):
+        """Retorna ``(búsqueda incremental, nombre)``; ``ValueError`` si no existe."""
+        try:
+            return SOLVERS[algorithm.upper()]
+        except KeyError:
+            raise ValueError(f"Algoritmo de resolución no soportado: {algorithm}") from None
+
+    def _cache_key(self, algorithm):
+        start, end = self.endpoints()
+        return self.fingerprint, start, end, algorithm.upper()
+
+    def cached_solution(self, algorithm):
+        """Solución ``(path, visited)`` en caché para el laberinto actual, o ``None``."""
+        entry = self.solution_cache.get(self._cache_key(algorithm))
+        if entry is None:
+            return None
+        return list(entry[0]), entry[1]
+
+    def store_solution(self, algorithm, path, visited):
+        """Guarda en caché una solución calculada fuera de la sesión."""
+        self.solution_cache.put(self._cache_key(algorithm), path, visited)
+
+    def solve(self, algorithm="BFS", progress=None):
+        """Resuelve el laberinto actual (usando la caché) y retorna ``(path, visited)``."""
+        search, name = self.solver(algorithm)
+        cached = self.cached_solution(algorithm)
+        if cached is not None:
+            return cached
+        start, end = self.endpoints()
+        path, visited = solve_in_order(search, self.graph, start, end, progress,
+                                       self.instrumentation, name)
+        self.store_solution(algorithm, path, visited)
+        return path, visited
+
+    def _drop_tree_index(self):
+        self._tree_index = None
+        self._tree_checked = False
+
+    def tree_index(self):
+        """
+        ``TreeIndex`` del laberinto actual si es perfecto, o ``None``.
+
+        Se construye una sola vez por laberinto, en la primera consulta, y se
+        descarta al reemplazar el laberinto o editar una pared.
+        """
+        self._require_graph()
+        if not self._tree_checked:
+            # Importación diferida: el índice trae NumPy
+            from model.tree_index import build_tree_index
+
+            self._tree_index = build_tree_index(self.graph)
+            self._tree_checked = True
+        return self._tree_index
+
+    def _query_endpoints(self, start, end):
+        if start is None or end is None:
+            entry, exit_ = self.endpoints()
+            start = entry if start is None else start
+            end = exit_ if end is None else end
+        return start, end
+
+    def path(self, start=None, end=None):
+        """
+        Camino entre dos celdas (por defecto, de la entrada a la salida).
+
+        En laberintos perfectos lo responde el índice de árbol en
+        O(longitud); en los demás, un BFS.
+        """
+        from model.tree_index import solve_maze_indexed
+
+        start, end = self._query_endpoints(start, end)
+        return solve_maze_indexed(self.graph, start, end, self.tree_index())[0]
+
+    def path_length(self, start=None, end=None):
+        """
+        Pasos del camino mínimo entre dos celdas (``None`` si no hay camino).
+
+        Con índice de árbol cuesta O(log n), sin recorrer el camino.
+        """
+        start, end = self._query_endpoints(start, end)
+        index = self.tree_index()
+        if index is not None:
+            return index.path_length(start, end)
+        path = self.path(start, end)
+        return len(path) - 1 if path else None
+
+    def toggle_wall(self, node1, node2):
+        """
+        Derriba o levanta la pared entre dos celdas vecinas del laberinto actual.
+
+        Retorna ``True`` si quedó un pasaje. Las soluciones en caché del
+        laberinto anterior se descartan; la búsqueda incremental, si existe,
+        queda avisada para ``repair_solution``.
+        """
+        self._require_graph()
+        opened = toggle_wall(self.graph, node1, node2)
+        self.solution_cache.invalidate(self.fingerprint)
+        self.fingerprint = maze_fingerprint(self.graph)
+        self._drop_tree_index()
+        if self.dynamic is not None:
+            self.dynamic.update_edge(node1, node2)
+        return opened
+
+    def repair_ready(self, algorithm="ASTAR"):
+        """Indica si ``repair_solution`` puede reutilizar una búsqueda previa."""
+        dynamic = self.dynamic
+        return (dynamic is not None
+                and dynamic.weighted == (algorithm.upper() in WEIGHTED_SOLVERS)
+                and (dynamic.start, dynamic.end) == self.endpoints())
+
+    def repair_solution(self, algorithm="ASTAR", progress=None):
+        """
+        Camino mínimo tras editar paredes, con búsqueda incremental (LPA*).
+
+        La primera llamada cuesta como una búsqueda completa; las siguientes
+        solo reexpanden las celdas afectadas por las paredes editadas. Con
+        Dijkstra o A* ponderado se respetan los costos del terreno. Retorna
+        ``(path, visited)`` con las celdas expandidas en esta reparación.
+        """
+        start, end = self.endpoints()
+        if not self.repair_ready(algorithm):
+            self.dynamic = DynamicSolver(self.graph, start, end,
+                                         weighted=algorithm.upper() in WEIGHTED_SOLVERS)
+        with measure(self.instrumentation, "repair", algorithm=algorithm) as record:
+            return self.dynamic.solve(progress, stats=record)
+
+    def analyze(self, progress=None):
+        """
+        Métricas de dificultad del laberinto actual (ver ``analyze_maze``).
+
+        Quedan también en las mediciones como fase ``"analyze"``.
+        """
+        self._require_graph()
+        with measure(self.instrumentation, "analyze") as record:
+            metrics = analyze_maze(self.graph, progress)
+            record.update(metrics)
+        return metrics
+
+    def export_metrics(self, path):
+        """Exporta las mediciones registradas (fases, duraciones y contadores)."""
+        self.instrumentation.export(path)
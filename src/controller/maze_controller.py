@@ -1,76 +1,300 @@
-from tkinter import messagebox
-from model.graph import Graph
-from model.algorithms import (
-    generate_maze_dfs, generate_maze_kruskal,
-    solve_maze_bfs, solve_maze_astar
-)
-from view.maze_view import MazeView
+import random
+
+from controller.headless import GENERATORS, MazeSession, build_maze, solve_in_order
+from controller.workers import WorkerPool
+from model.instrumentation import describe
+
+# Color del camino según el algoritmo de resolución
+SOLUTION_COLORS = {
+    "ASTAR": "#057032",
+    "BFS": "#6909C8",
+    "DIJKSTRA": "#C8690A",
+    "WASTAR": "#057032",
+}
+
+
+def _show_error(text):
+    """Muestra un cuadro de error (tkinter se importa recién al necesitarlo)."""
+    from tkinter import messagebox
+
+    messagebox.showerror("Error", text)
+
+
+def _format_metrics(metrics):
+    """Resumen de ``analyze_maze`` para la etiqueta de información."""
+    length = metrics["solution_length"]
+    solution = (f"solución {length} pasos ({metrics['solution_share']:.1%} de las celdas)"
+                if length is not None else "sin solución")
+    return (f"{metrics['dead_ends']} callejones ({metrics['dead_end_ratio']:.1%}) | "
+            f"{metrics['junctions']} cruces | {metrics['corridors']} pasillos\n"
+            f"{solution} | diámetro {metrics['diameter']}")
 
 
 class MazeController:
-    """Controlador principal que conecta la vista con la lógica del laberinto."""
+    """
+    Controlador principal que conecta la vista con la lógica del laberinto.
+
+    La lógica vive en ``MazeSession`` (sin dependencias de Tk); este
+    controlador agrega la ventana, los trabajos en segundo plano y los
+    diálogos de error.
+    """
 
     def __init__(self, root):
-        self.graph = None
+        # Importación diferida: la vista arrastra customtkinter
+        from view.maze_view import MazeView
+
+        self.session = MazeSession()
+        self.workers = WorkerPool(root)
+        self._solve_task = None
+        self._repair_task = None
+        # Solución mostrada (algoritmo, camino, color), para repararla al editar paredes
+        self._shown = None
         self.view = MazeView(root, self)
 
-    def generate_maze(self, width, height, algorithm):
-        """Genera un nuevo laberinto (DFS, Kruskal o Prim)."""
-        self.graph = Graph(width, height)
+    @property
+    def graph(self):
+        """Laberinto actual (o ``None``)."""
+        return self.session.graph
 
-        self.view.update_info(f"Generando laberinto con {algorithm}...")
+    @property
+    def instrumentation(self):
+        """Mediciones de la sesión."""
+        return self.session.instrumentation
 
-        if algorithm == "DFS":
-            generate_maze_dfs(self.graph)
-        elif algorithm == "Kruskal":
-            generate_maze_kruskal(self.graph)
-        else:
-            messagebox.showerror("Error", f"Algoritmo '{algorithm}' no soportado.")
+    def generate_maze(self, width, height, algorithm, seed=None, terrain=False):
+        """
+        Genera un nuevo laberinto (DFS, Kruskal o Prim) en segundo plano.
+
+        Si no se indica ``seed`` se sortea una; queda guardada en
+        ``self.session.seed`` para poder reproducir el mismo laberinto. Con
+        ``terrain`` las celdas tienen costos (ver ``build_maze``).
+        Cancela la generación o resolución que estuviera en curso.
+        """
+        if algorithm not in GENERATORS:
+            _show_error(f"Algoritmo '{algorithm}' no soportado.")
             return
 
-        self.view.draw_maze(self.graph)
+        if seed is None:
+            seed = random.randrange(2 ** 63)
+        self.workers.cancel_all()
+        self.view.cancel_animation()
+        total = width * height
 
-        nodes = len(self.graph.nodes())
-        edges = sum(len(v) for v in self.graph.adjacency.values()) // 2
-        self.view.update_info(f"Laberinto generado con {algorithm}  | {nodes} nodos, {edges} aristas")
+        self.view.update_info(f"Generando laberinto con {algorithm}...")
+        self.workers.submit(
+            f"Generar ({algorithm})", build_maze, width, height, algorithm, seed,
+            instrumentation=self.instrumentation, terrain=terrain,
+            on_progress=lambda cells: self.view.update_info(
+                f"Generando laberinto con {algorithm}... {cells * 100 // total}%"
+            ),
+            on_done=lambda graph: self._finish_generation(graph, algorithm, seed),
+            on_error=self._show_task_error,
+        )
 
-    def solve_maze(self, algorithm):
-        """Resuelve el laberinto con BFS, A* o Dijkstra."""
+    def _finish_generation(self, graph, algorithm, seed):
+        """Publica un laberinto recién generado (en el hilo de la interfaz)."""
+        self.session.set_graph(graph, seed, algorithm)
+        self._shown = None
+
+        with self.instrumentation.phase("render", mode="maze") as record:
+            mark = self.view.canvas_mark()
+            self.view.draw_maze(graph)
+            record["canvas_items"] = self.view.items_created_since(mark)
+
+        nodes = graph.width * graph.height
+        summary = " | ".join(
+            describe(self.instrumentation.last(phase))
+            for phase in ("carve", "extra_passages", "render")
+        )
+        self.view.update_info(
+            f"Laberinto generado con {algorithm}  | {nodes} nodos, {graph.edge_count} aristas\n"
+            f"{summary}"
+        )
+
+    def _show_task_error(self, error):
+        _show_error(f"La operación falló: {error}")
+        self.view.update_info("Operación interrumpida por un error")
+
+    def analyze_maze(self):
+        """Calcula en segundo plano las métricas de dificultad y las muestra."""
         if not self.graph:
-            messagebox.showerror("Error", "Primero debes generar un laberinto.")
+            _show_error("Primero debes generar un laberinto.")
             return
+        graph = self.graph
 
-        start = self.graph.entry
-        end = self.graph.exit
+        def finish(metrics):
+            if graph is self.graph:
+                self.view.update_info(_format_metrics(metrics))
 
-        if not start or not end:
-            messagebox.showerror("Error", "El laberinto no tiene puntos de entrada o salida.")
+        self.view.update_info("Analizando laberinto...")
+        self.workers.submit(
+            "Analizar", self.session.analyze,
+            on_done=finish,
+            on_error=self._show_task_error,
+        )
+
+    def export_metrics(self, path):
+        """Exporta las mediciones registradas (fases, duraciones y contadores)."""
+        self.session.export_metrics(path)
+        self.view.update_info(f"Métricas exportadas a {path}")
+
+    def save_to_file(self, path):
+        """Guarda el laberinto actual en formato binario .maze."""
+        try:
+            self.session.save(path)
+        except ValueError as error:
+            _show_error(str(error))
+            return
+        self.view.update_info(f"Laberinto guardado en {path}")
+
+    def load_from_file(self, path):
+        """Carga un laberinto .maze y lo dibuja."""
+        self.workers.cancel_all()
+        try:
+            graph = self.session.load(path)
+        except (OSError, ValueError) as error:
+            _show_error(f"No se pudo abrir el laberinto: {error}")
             return
+        self._shown = None
+
+        self.view.mode = "maze"
+        self.view.fit_cell_size(graph.width, graph.height)
+        self.view.resize_canvas(graph.width, graph.height)
+        self.view.draw_maze(graph)
+        self.view.update_info(f"Laberinto cargado: {graph.width}x{graph.height} celdas")
+
+    def solve_maze(self, algorithm):
+        """
+        Resuelve el laberinto con BFS, A* o Dijkstra.
 
+        Las soluciones cacheadas se muestran de inmediato; las demás se
+        calculan en segundo plano mostrando los nodos expandidos. Si el
+        laberinto tiene terreno, A* usa la versión ponderada.
+        """
         algorithm = algorithm.upper()
+        if algorithm == "ASTAR" and self.graph is not None and self.graph.costs is not None:
+            algorithm = "WASTAR"
+        try:
+            start, end = self.session.endpoints()
+            search, algo_name = self.session.solver(algorithm)
+        except ValueError as error:
+            _show_error(str(error))
+            return
+        color = SOLUTION_COLORS.get(algorithm, "#057032")
 
-        if self.view.mode == "maze":
-            self.view.draw_maze(self.graph)
-        else:
-            self.view.draw_graph(self.graph)
-
-        self.view.update_info(f"Resolviendo con {algorithm}...")
-
-        if algorithm == "ASTAR":
-            path, visited = solve_maze_astar(self.graph, start, end)
-            color = "#057032"
-            algo_name = "A*"
-        elif algorithm == "BFS":
-            path, visited = solve_maze_bfs(self.graph, start, end)
-            color = "#6909C8"
-            algo_name = "BFS"
-        else:
-            messagebox.showerror("Error", f"Algoritmo de resolución no soportado: {algorithm}")
+        # En el visor por teselas o en raster la solución se dibuja junto con el laberinto
+        if not self.view.solution_is_static(self.graph):
+            if self.view.mode == "maze":
+                self.view.draw_maze(self.graph)
+            else:
+                self.view.draw_graph(self.graph)
+
+        self.view.update_info(f"Resolviendo con {algo_name}...")
+
+        if self._solve_task is not None:
+            self._solve_task.cancel()
+        cached = self.session.cached_solution(algorithm)
+        if cached is not None:
+            self._shown = (algorithm, cached[0], color)
+            self._show_solution(*cached, algo_name, color, cached=True)
             return
+        self._shown = None
 
+        graph = self.graph
+
+        def finish(result):
+            # Si el laberinto cambió mientras tanto, la solución ya no sirve
+            if graph is self.graph:
+                path, visited = result
+                self.session.store_solution(algorithm, path, visited)
+                self._shown = (algorithm, path, color)
+                self._show_solution(path, visited, algo_name, color)
+
+        self._solve_task = self.workers.submit(
+            f"Resolver ({algo_name})", solve_in_order, search, graph, start, end,
+            instrumentation=self.instrumentation, algorithm=algo_name,
+            on_progress=lambda nodes: self.view.update_info(
+                f"Resolviendo con {algo_name}... {nodes} nodos expandidos"
+            ),
+            on_done=finish,
+            on_error=self._show_task_error,
+        )
+
+    def _show_solution(self, path, visited, algo_name, color, cached=False):
+        """Dibuja la solución o avisa que no hay camino."""
         if path:
-            self.view.update_info(f"Resolviendo con {algo_name}...")
-            self.view.draw_path_animated(path, delay=30, visited=visited, color=color)
+            with self.instrumentation.phase("render", mode="solution") as record:
+                details = "solución en caché" if cached else describe(
+                    self.instrumentation.last("solve")
+                )
+                mark = self.view.canvas_mark()
+                self.view.show_solution(self.graph, path, visited, color=color, details=details)
+                record["canvas_items"] = self.view.items_created_since(mark)
         else:
-            messagebox.showerror("Error", "No se encontró un camino entre la entrada y la salida.")
+            _show_error("No se encontró un camino entre la entrada y la salida.")
             self.view.update_info("No hay solución disponible")
+
+    def toggle_wall(self, node1, node2):
+        """
+        Derriba o levanta la pared entre dos celdas y repara la solución mostrada.
+
+        La reparación es incremental (ver ``MazeSession.repair_solution``): la
+        primera vez se hace en segundo plano porque cuesta como una búsqueda
+        completa; después tarda milisegundos y se hace en el momento. Mientras
+        corre esa primera búsqueda no se aceptan ediciones. Una resolución en
+        curso se cancela y se espera a que termine antes de tocar el grafo.
+        """
+        if self._repair_task is not None and not self._repair_task.future.done():
+            self.view.update_info("Esperando la reparación del camino...")
+            return
+        if self._solve_task is not None and not self._solve_task.future.done():
+            # La búsqueda lee el grafo desde otro hilo: hay que esperar a que
+            # se detenga antes de editarlo.
+            self._solve_task.cancel(wait=True)
+        try:
+            opened = self.session.toggle_wall(node1, node2)
+        except ValueError as error:
+            _show_error(str(error))
+            return
+        self.view.draw_wall_edit(self.graph, node1, node2, opened)
+
+        action = "derribada" if opened else "levantada"
+        if self._shown is None:
+            self.view.update_info(f"Pared {action} entre {node1} y {node2}")
+            return
+
+        algorithm = self._shown[0]
+        if self.session.repair_ready(algorithm):
+            self._finish_repair(self.session.repair_solution(algorithm), action)
+            return
+
+        graph = self.graph
+
+        def finish(result):
+            if graph is self.graph:
+                self._finish_repair(result, action)
+
+        self.view.update_info(f"Pared {action}: reparando el camino...")
+        self._repair_task = self.workers.submit(
+            "Reparar camino", self.session.repair_solution, algorithm,
+            on_done=finish,
+            on_error=self._show_task_error,
+        )
+
+    def _finish_repair(self, result, action):
+        """Dibuja solo los tramos del camino que cambiaron tras una edición."""
+        path, visited = result
+        algorithm, old_path, color = self._shown
+        self._shown = (algorithm, path, color)
+        with self.instrumentation.phase("render", mode="repair") as record:
+            mark = self.view.canvas_mark()
+            self.view.update_path(self.graph, old_path, path, color)
+            record["canvas_items"] = self.view.items_created_since(mark)
+
+        details = describe(self.instrumentation.last("repair"))
+        if path:
+            self.view.update_info(f"Pared {action} | camino reparado: {len(path) - 1} pasos\n"
+                                  f"{details}")
+        else:
+            self.view.update_info(f"Pared {action} | ya no hay camino entre la entrada y la "
+                                  f"salida\n{details}")
@@ -0,0 +1,124 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+
+
+class TaskCancelled(Exception):
+    """Se lanza dentro de un trabajo cuya cancelación fue pedida."""
+
+
+class Task:
+    """
+    Trabajo en segundo plano: progreso, cancelación cooperativa y resultado.
+
+    El algoritmo recibe ``task.report`` como callback de progreso. Cada
+    llamada guarda el valor (la interfaz lo lee al sondear) y, si se pidió
+    cancelar, lanza ``TaskCancelled`` para cortar el algoritmo en ese punto.
+    """
+
+    def __init__(self, name, on_progress=None, on_done=None, on_error=None):
+        """Crea el trabajo; ``WorkerPool.submit`` le asigna ``future``."""
+        self.name = name
+        self.progress = None
+        self.future = None
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.on_error = on_error
+        self._reported = None
+        self._cancel = threading.Event()
+
+    @property
+    def cancelled(self):
+        """Indica si se pidió cancelar el trabajo."""
+        return self._cancel.is_set()
+
+    def cancel(self, wait=False):
+        """
+        Pide cancelar el trabajo; si aún no empezó, no llega a ejecutarse.
+
+        Con ``wait`` además espera a que el hilo trabajador lo abandone (en su
+        próximo ``report``), así que después se pueden modificar sin riesgo los
+        datos que el trabajo estaba leyendo.
+        """
+        self._cancel.set()
+        if self.future is not None:
+            self.future.cancel()
+            if wait:
+                wait_futures([self.future])
+
+    def report(self, value):
+        """Callback de progreso para el algoritmo (se ejecuta en el hilo trabajador)."""
+        if self._cancel.is_set():
+            raise TaskCancelled(self.name)
+        self.progress = value
+
+
+class WorkerPool:
+    """
+    Ejecuta generadores y solucionadores fuera del hilo de Tk.
+
+    Los trabajos corren en un ``ThreadPoolExecutor``; un sondeo con
+    ``widget.after`` entrega el progreso y los resultados en el hilo de la
+    interfaz, que es el único que toca los widgets. Con un solo trabajador
+    los trabajos se ejecutan en el orden en que se enviaron.
+    """
+
+    def __init__(self, widget, max_workers=1, poll_ms=50):
+        """``widget`` es cualquier widget de Tk, usado para ``after``."""
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="maze-worker")
+        self._tasks = []
+        self._after = None
+
+    def submit(self, name, function, *args, on_progress=None, on_done=None, on_error=None,
+               **kwargs):
+        """
+        Ejecuta ``function(*args, progress=task.report, **kwargs)`` en segundo plano.
+
+        ``on_progress(valor)``, ``on_done(resultado)`` y ``on_error(excepción)``
+        se llaman en el hilo de Tk. Un trabajo cancelado no llama a ninguno.
+        Retorna el ``Task``.
+        """
+        task = Task(name, on_progress, on_done, on_error)
+        task.future = self._executor.submit(function, *args, progress=task.report, **kwargs)
+        self._tasks.append(task)
+        if self._after is None:
+            self._after = self.widget.after(self.poll_ms, self._poll)
+        return task
+
+    def cancel_all(self):
+        """Pide cancelar todos los trabajos pendientes o en curso."""
+        for task in self._tasks:
+            task.cancel()
+
+    def shutdown(self):
+        """Cancela los trabajos y libera los hilos."""
+        self.cancel_all()
+        if self._after is not None:
+            self.widget.after_cancel(self._after)
+            self._after = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _poll(self):
+        self._after = None
+        # Los callbacks pueden enviar trabajos nuevos mientras se recorre la lista
+        tasks, self._tasks = self._tasks, []
+        pending = []
+        for task in tasks:
+            if not task.future.done():
+                if task.on_progress and task.progress != task._reported and not task.cancelled:
+                    task._reported = task.progress
+                    task.on_progress(task.progress)
+                pending.append(task)
+            elif not task.cancelled and not task.future.cancelled():
+                error = task.future.exception()
+                if error is None:
+                    if task.on_done:
+                        task.on_done(task.future.result())
+                elif not isinstance(error, TaskCancelled) and task.on_error:
+                    task.on_error(error)
+
+        self._tasks = pending + self._tasks
+        if self._tasks and self._after is None:
+            self._after = self.widget.after(self.poll_ms, self._poll)
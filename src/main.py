@@ -1,10 +1,11 @@
-import customtkinter as ctk
-
-from controller.maze_controller import MazeController
-
-
 def main():
     """Función principal que inicia la aplicación."""
+    # Importaciones diferidas: la interfaz gráfica solo se carga al abrir la
+    # ventana, así el resto de los módulos se puede importar sin Tk.
+    import customtkinter as ctk
+
+    from controller.maze_controller import MazeController
+
     # Configurar tema de customtkinter
     ctk.set_appearance_mode("dark")
     ctk.set_default_color_theme("blue")
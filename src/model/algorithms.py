@@ -1,6 +1,10 @@
 import heapq
-import random
-from collections import deque
+from array import array
+from itertools import islice, repeat
+
+from model.graph import EAST, NORTH, SOUTH, WEST, GridGraph
+from model.instrumentation import measure
+from model.rng import make_rng
 
 
 class DisjointSet:
@@ -39,40 +43,127 @@ class DisjointSet:
         return False
 
 
-def assign_entry_exit(graph):
+def assign_entry_exit(graph, rng=None):
     """Asigna entrada y salida aleatorias (preferencia izquierda → derecha)."""
+    rng = make_rng(rng)
     entry_candidates = [(0, y) for y in range(graph.height)]
     exit_candidates = [(graph.width - 1, y) for y in range(graph.height)]
 
-    graph.entry = random.choice(entry_candidates)
-    graph.exit = random.choice(exit_candidates)
+    graph.entry = rng.choice(entry_candidates)
+    graph.exit = rng.choice(exit_candidates)
+
+
+# Cada cuántos pasos los algoritmos llaman a ``progress``
+PROGRESS_INTERVAL = 4096
+
+
+def carve_maze_dfs(graph, start=None, rng=None, progress=None, stats=None):
+    """
+    Backtracking recursivo con una pila explícita de índices planos.
 
+    No depende del límite de recursión de Python: la pila es un ``array`` de
+    enteros y las celdas visitadas un ``bytearray``, así que la memoria queda
+    acotada a unos pocos bytes por celda incluso en cuadrículas de 10k x 10k.
+    Sobre ``GridGraph`` escribe los bits de pasaje directamente.
 
-def generate_maze_dfs(graph):
-    """Genera un laberinto usando DFS recursivo directamente sobre el grafo."""
+    ``progress(celdas)`` se llama periódicamente con las celdas talladas; si
+    lanza una excepción la generación se interrumpe (cancelación cooperativa).
+    Si se pasa el diccionario ``stats``, se completa con ``cells_carved``.
+    """
+    rng = make_rng(rng)
     width, height = graph.width, graph.height
-    visited = set()
-    directions = [(0, -1), (0, 1), (1, 0), (-1, 0)]
+    total = width * height
+    if total == 0:
+        return
+
+    passages = graph.passages if isinstance(graph, GridGraph) else None
+    visited = bytearray(total)
+    stack = array("i" if total < 2 ** 31 else "q")
+    push, pop = stack.append, stack.pop
+    rand = rng.random
+    last_row = total - width
+
+    if start is None:
+        current = rng.randrange(total)
+    else:
+        current = start[1] * width + start[0]
+    visited[current] = 1
+    push(current)
+    carved = 1
+
+    while stack:
+        current = stack[-1]
+        x = current % width
+        steps = []
+        if current >= width and not visited[current - width]:
+            steps.append(-width)
+        if current < last_row and not visited[current + width]:
+            steps.append(width)
+        if x < width - 1 and not visited[current + 1]:
+            steps.append(1)
+        if x and not visited[current - 1]:
+            steps.append(-1)
+
+        if not steps:
+            pop()
+            continue
 
-    def dfs(x, y):
-        visited.add((x, y))
-        random.shuffle(directions)
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < width and 0 <= ny < height and (nx, ny) not in visited:
-                graph.add_edge((x, y), (nx, ny))
-                dfs(nx, ny)
+        step = steps[int(rand() * len(steps))] if len(steps) > 1 else steps[0]
+        nxt = current + step
+        if passages is None:
+            graph.add_edge((x, current // width), (nxt % width, nxt // width))
+        elif step == width:
+            passages[current] |= SOUTH
+            passages[nxt] |= NORTH
+        elif step == -width:
+            passages[current] |= NORTH
+            passages[nxt] |= SOUTH
+        elif step == 1:
+            passages[current] |= EAST
+            passages[nxt] |= WEST
+        else:
+            passages[current] |= WEST
+            passages[nxt] |= EAST
+        visited[nxt] = 1
+        push(nxt)
+        carved += 1
+        if progress is not None and not carved % PROGRESS_INTERVAL:
+            progress(carved)
 
-    # Comienza desde una celda aleatoria
-    start = (random.randint(0, width - 1), random.randint(0, height - 1))
-    dfs(*start)
+    if passages is not None:
+        graph.edge_count += carved - 1
+    if stats is not None:
+        stats["cells_carved"] = carved
 
-    add_extra_passages(graph, ratio=0.5)
-    assign_entry_exit(graph)
 
+def generate_maze_dfs(graph, ratio=0.5, rng=None, progress=None, instrumentation=None):
+    """
+    Genera un laberinto usando DFS (backtracking con pila explícita) sobre el grafo.
 
-def generate_maze_kruskal(graph):
-    """Genera un laberinto usando el algoritmo de Kruskal directamente sobre el grafo."""
+    ``rng`` acepta una semilla entera o un ``random.Random``: la misma
+    combinación (tamaño, algoritmo, ratio, semilla) produce el mismo laberinto.
+    ``progress`` se comporta como en ``carve_maze_dfs``. Con una
+    ``Instrumentation`` se registran las fases de tallado y pasajes extra.
+    """
+    rng = make_rng(rng)
+    with measure(instrumentation, "carve", algorithm="DFS",
+                 width=graph.width, height=graph.height) as record:
+        carve_maze_dfs(graph, rng=rng, progress=progress, stats=record)
+
+    with measure(instrumentation, "extra_passages", ratio=ratio) as record:
+        _add_extra_passages_fast(graph, ratio, rng, record)
+    assign_entry_exit(graph, rng=rng)
+
+
+def carve_maze_kruskal(graph, rng=None, progress=None, stats=None):
+    """
+    Talla un árbol de expansión aleatorio con el algoritmo de Kruskal.
+
+    ``progress(celdas)`` se llama periódicamente con las celdas ya unidas al
+    árbol; si lanza una excepción la generación se interrumpe. Si se pasa
+    ``stats``, se completa con ``cells_carved``.
+    """
+    rng = make_rng(rng)
     width, height = graph.width, graph.height
     ds = DisjointSet(width, height)
     edges = []
@@ -85,64 +176,150 @@ def generate_maze_kruskal(graph):
             if y < height - 1:
                 edges.append(((x, y), (x, y + 1)))
 
-    random.shuffle(edges)
+    rng.shuffle(edges)
 
     # Construir MST
+    joined = 1
     for a, b in edges:
         if ds.union(a, b):
             graph.add_edge(a, b)
+            joined += 1
+            if progress is not None and not joined % PROGRESS_INTERVAL:
+                progress(joined)
+
+    if stats is not None:
+        stats["cells_carved"] = joined
+
+
+def generate_maze_kruskal(graph, ratio=0.3, rng=None, progress=None, instrumentation=None):
+    """
+    Genera un laberinto usando el algoritmo de Kruskal directamente sobre el grafo.
+
+    ``progress`` e ``instrumentation`` se comportan como en ``generate_maze_dfs``.
+    """
+    rng = make_rng(rng)
+    with measure(instrumentation, "carve", algorithm="Kruskal",
+                 width=graph.width, height=graph.height) as record:
+        carve_maze_kruskal(graph, rng=rng, progress=progress, stats=record)
 
-    add_extra_passages(graph, ratio=0.3)
-    assign_entry_exit(graph)
+    with measure(instrumentation, "extra_passages", ratio=ratio) as record:
+        _add_extra_passages_fast(graph, ratio, rng, record)
+    assign_entry_exit(graph, rng=rng)
+
+
+def _add_extra_passages_fast(graph, ratio, rng, stats):
+    """
+    Pasajes extra por lotes con NumPy (``add_extra_passages_batched``).
 
+    Se importa al primer uso porque ``model.vectorized`` depende de este
+    módulo. ``stats`` recibe ``passages_added`` como en ``add_extra_passages``.
+    """
+    from model.vectorized import add_extra_passages_batched
+
+    stats["passages_added"] = add_extra_passages_batched(graph, ratio, rng=rng)
+
+
+def add_extra_passages(graph, ratio, rng=None, stats=None):
+    """
+    Agrega pasajes extra aleatorios para aumentar conectividad.
 
-def add_extra_passages(graph, ratio):
-    """Agrega pasajes extra aleatorios para aumentar conectividad."""
+    Si se pasa ``stats``, se completa con ``passages_added`` (los pasajes
+    realmente nuevos, según ``graph.edge_count``).
+    """
+    rng = make_rng(rng)
+    before = graph.edge_count
     count = int(graph.width * graph.height * ratio)
     for _ in range(count):
-        x = random.randint(0, graph.width - 2)
-        y = random.randint(0, graph.height - 2)
-        if random.choice([True, False]):
+        x = rng.randint(0, graph.width - 2)
+        y = rng.randint(0, graph.height - 2)
+        if rng.choice([True, False]):
             neighbor = (x + 1, y)
         else:
             neighbor = (x, y + 1)
         graph.add_edge((x, y), neighbor)
 
+    if stats is not None:
+        stats["passages_added"] = graph.edge_count - before
 
-def solve_maze_bfs(graph, start, end):
-    """
-    Resuelve el laberinto usando BFS.
-    """
-    queue = deque([start])
-    visited = {start}
-    came_from = {}
-
-    while queue:
-        current = queue.popleft()
-        if current == end:
-            break
-
-        for neighbor in graph.neighbors(current):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                came_from[neighbor] = current
-                queue.append(neighbor)
 
-    # Reconstrucción del camino
+def _reconstruct(came_from, start, end):
+    """Reconstruye el camino de ``start`` a ``end``; lista vacía si no hay."""
     path = []
     current = end
     while current != start:
         path.append(current)
         current = came_from.get(current)
         if current is None:
-            return [], visited
+            return []
     path.append(start)
     path.reverse()
-    return path, visited
+    return path
+
 
+def drain(search):
+    """Consume un generador de búsqueda y retorna su resultado ``(path, visited)``."""
+    try:
+        while True:
+            next(search)
+    except StopIteration as stop:
+        return stop.value
 
-def solve_maze_astar(graph, start, end):
-    """Resuelve el laberinto usando el algoritmo A*."""
+
+def _bfs_search(graph, start, end, batch_size=None, progress=None, stats=None):
+    """
+    Núcleo de BFS como generador.
+
+    Con ``batch_size`` produce listas con los nodos expandidos, en orden de
+    expansión, de a ``batch_size``; con ``None`` no produce nada y solo
+    retorna. El valor de retorno (``StopIteration.value``) es ``(path, visited)``.
+    Si se pasa ``stats``, se completa con ``nodes_expanded``.
+
+    Los lotes y ``progress`` se atienden una vez por ronda de expansiones y
+    no por nodo: el bucle interno es tan liviano como un BFS sin lotes.
+    """
+    # La cola es una lista que no se vacía: los nodos de una ronda son un
+    # tramo contiguo de ``queue`` y el lote sale de ahí sin anotarlos uno a uno.
+    queue = [start]
+    visited = {start}
+    came_from = {}
+    pending = iter(queue)  # el iterador de lista ve los nodos agregados después
+    neighbors, mark, push = graph.neighbors, visited.add, queue.append
+    interval = batch_size or PROGRESS_INTERVAL
+    taken = 0
+    found = False
+
+    while True:
+        index = taken - 1
+        for index, current in enumerate(islice(pending, interval), taken):
+            if current == end:
+                found = True
+                break
+            for neighbor in neighbors(current):
+                if neighbor not in visited:
+                    mark(neighbor)
+                    came_from[neighbor] = current
+                    push(neighbor)
+
+        if batch_size and index >= taken:
+            yield queue[taken:index + 1]
+        exhausted = index + 1 < taken + interval
+        taken = index + 1
+        if found or exhausted:
+            break
+        if progress is not None:
+            progress(taken)
+
+    if stats is not None:
+        stats["nodes_expanded"] = taken - found
+    return _reconstruct(came_from, start, end), visited
+
+
+def _astar_search(graph, start, end, batch_size=None, progress=None, stats=None):
+    """
+    Núcleo de A* como generador; mismo protocolo que ``_bfs_search``.
+
+    ``stats`` recibe además ``heap_pushes`` y ``heap_pops``.
+    """
 
     def heuristic(a, b):
         return abs(a[0] - b[0]) + abs(a[1] - b[1])  # Distancia Manhattan
@@ -155,42 +332,103 @@ def solve_maze_astar(graph, start, end):
     f_score = {start: heuristic(start, end)}
     visited = set()
     in_open = {start}
+    interval = batch_size or PROGRESS_INTERVAL
+    neighbors, heappop, heappush = graph.neighbors, heapq.heappop, heapq.heappush
+    found = False
+
+    # Sin lotes, expandir es solo agregar a ``visited``; con lotes se anota
+    # además el orden. La elección se hace una vez, fuera del bucle.
+    if batch_size:
+        order = []
+
+        def expand(node):
+            visited.add(node)
+            order.append(node)
+    else:
+        expand = visited.add
+
+    while open_heap and not found:
+        for _ in repeat(None, interval):
+            if not open_heap:
+                break
+            _, current = heappop(open_heap)
+            in_open.discard(current)
+
+            if current in visited:
+                continue
 
-    while open_heap:
-        _, current = heapq.heappop(open_heap)
-        in_open.discard(current)
+            expand(current)
+            if current == end:
+                found = True
+                break
 
-        if current in visited:
-            continue
+            for neighbor in neighbors(current):
+                if neighbor in visited:
+                    continue
 
-        visited.add(current)
+                tentative_g = g_score[current] + 1
 
-        if current == end:
-            break
+                if neighbor not in g_score or tentative_g < g_score[neighbor]:
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g
+                    f_score[neighbor] = tentative_g + heuristic(neighbor, end)
 
-        for neighbor in graph.neighbors(current):
-            if neighbor in visited:
-                continue
+                    if neighbor not in in_open:
+                        heappush(open_heap, (f_score[neighbor], neighbor))
+                        in_open.add(neighbor)
 
-            tentative_g = g_score[current] + 1
+        if batch_size and order:
+            yield order
+            order = []
+        if progress is not None and not found:
+            progress(len(visited))
 
-            if neighbor not in g_score or tentative_g < g_score[neighbor]:
-                came_from[neighbor] = current
-                g_score[neighbor] = tentative_g
-                f_score[neighbor] = tentative_g + heuristic(neighbor, end)
+    if stats is not None:
+        # Cada nodo entra al heap una sola vez (``in_open`` y ``visited`` lo
+        # impiden), así que los contadores salen de los conjuntos al final.
+        stats["nodes_expanded"] = len(visited)
+        stats["heap_pushes"] = len(g_score)
+        stats["heap_pops"] = len(g_score) - len(open_heap)
+    return _reconstruct(came_from, start, end), visited
 
-                if neighbor not in in_open:
-                    heapq.heappush(open_heap, (f_score[neighbor], neighbor))
-                    in_open.add(neighbor)
 
-    # Reconstrucción del camino
-    path = []
-    current = end
-    while current != start:
-        path.append(current)
-        current = came_from.get(current)
-        if current is None:
-            return [], visited
-    path.append(start)
-    path.reverse()
-    return path, visited
+def solve_maze_bfs(graph, start, end, progress=None, stats=None):
+    """
+    Resuelve el laberinto usando BFS.
+
+    ``progress(nodos)`` se llama periódicamente con los nodos expandidos; si
+    lanza una excepción la búsqueda se interrumpe. ``stats`` recibe los
+    contadores de la búsqueda (``nodes_expanded``).
+    """
+    return drain(_bfs_search(graph, start, end, progress=progress, stats=stats))
+
+
+def solve_maze_astar(graph, start, end, progress=None, stats=None):
+    """
+    Resuelve el laberinto usando el algoritmo A*.
+
+    ``progress`` se comporta como en ``solve_maze_bfs``; ``stats`` recibe
+    ``nodes_expanded``, ``heap_pushes`` y ``heap_pops``.
+    """
+    return drain(_astar_search(graph, start, end, progress=progress, stats=stats))
+
+
+def iter_solve_bfs(graph, start, end, batch_size=256, stats=None):
+    """
+    Variante incremental de ``solve_maze_bfs``.
+
+    Produce listas de hasta ``batch_size`` nodos en el orden real de
+    expansión. Al agotarse, ``StopIteration.value`` (o ``yield from``, o
+    ``drain``) da ``(path, visited)``. Quien consume puede dejar de iterar en
+    cualquier momento sin pagar el resto de la búsqueda.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size debe ser al menos 1.")
+    return _bfs_search(graph, start, end, batch_size, stats=stats)
+
+
+def iter_solve_astar(graph, start, end, batch_size=256, stats=None):
+    """Variante incremental de ``solve_maze_astar`` (ver ``iter_solve_bfs``)."""
+    if batch_size < 1:
+        raise ValueError("batch_size debe ser al menos 1.")
+    return _astar_search(graph, start, end, batch_size, stats=stats)
@@ -0,0 +1,169 @@
+import heapq
+from array import array
+
+from model.algorithms import PROGRESS_INTERVAL
+from model.solvers import _to_nodes, neighbor_function
+
+
+def toggle_wall(graph, node1, node2):
+    """
+    Derriba o levanta la pared entre dos celdas vecinas.
+
+    Retorna ``True`` si quedó un pasaje y ``False`` si quedó una pared. Lanza
+    ``ValueError`` si las celdas no son vecinas o están fuera del laberinto.
+    """
+    (x1, y1), (x2, y2) = node1, node2
+    if abs(x1 - x2) + abs(y1 - y2) != 1:
+        raise ValueError(f"Las celdas {node1} y {node2} no son adyacentes.")
+    for x, y in (node1, node2):
+        if not (0 <= x < graph.width and 0 <= y < graph.height):
+            raise ValueError(f"La celda {(x, y)} está fuera de la cuadrícula.")
+
+    if node2 in graph.neighbors(node1):
+        graph.remove_edge(node1, node2)
+        return False
+    graph.add_edge(node1, node2)
+    return True
+
+
+class DynamicSolver:
+    """
+    Camino mínimo que se repara tras editar paredes (Lifelong Planning A*).
+
+    Conserva entre ediciones las distancias ``g`` y las estimaciones de un
+    paso ``rhs`` de cada celda. Después de cambiar una pared solo se
+    recalculan las celdas cuya distancia cambió, así que una edición lejos
+    del camino no cuesta casi nada. Con ``weighted`` usa ``graph.costs``
+    (costo de entrar a cada celda) si el laberinto tiene terreno.
+
+    Uso: ``solve()`` para la primera búsqueda y, tras cada edición hecha con
+    ``set_passage`` (o a mano seguida de ``update_edge``), de nuevo
+    ``solve()``, que retorna ``(path, visited)`` con las celdas expandidas en
+    esa llamada.
+    """
+
+    def __init__(self, graph, start, end, weighted=True):
+        """Prepara la búsqueda entre ``start`` y ``end`` sin expandir nada."""
+        self.graph = graph
+        self.start = start
+        self.end = end
+        width = graph.width
+        total = width * graph.height
+        self.width = width
+        self.total = total
+        self._neighbors = neighbor_function(graph)
+        self.weighted = weighted
+        self.costs = getattr(graph, "costs", None) if weighted else None
+        self._min_cost = min(self.costs) if self.costs else 1
+        self._source = start[1] * width + start[0]
+        self._target = end[1] * width + end[0]
+
+        # Las claves (k1, k2) se codifican en un solo entero, como en
+        # model.weighted: (k1 * escala + k2) * total + índice.
+        max_cost = max(self.costs) if self.costs else 1
+        self.infinity = max_cost * total + 1
+        self._scale = self.infinity + max_cost * (width + graph.height) + 1
+        self.g = array("q", [self.infinity]) * total
+        self.rhs = array("q", [self.infinity]) * total
+        self.rhs[self._source] = 0
+        self.heap = [self._encode(self._source)]
+
+    def _heuristic(self, index):
+        y, x = divmod(index, self.width)
+        return self._min_cost * (abs(x - self.end[0]) + abs(y - self.end[1]))
+
+    def _key(self, index):
+        best = min(self.g[index], self.rhs[index])
+        return (best + self._heuristic(index)) * self._scale + best
+
+    def _encode(self, index):
+        return self._key(index) * self.total + index
+
+    def _cost(self, index):
+        return self.costs[index] if self.costs is not None else 1
+
+    def _update(self, index):
+        """Recalcula ``rhs`` de una celda y la encola si quedó inconsistente."""
+        if index != self._source:
+            g = self.g
+            best = min((g[neighbor] for neighbor in self._neighbors(index)),
+                       default=self.infinity)
+            self.rhs[index] = min(self.infinity, best + self._cost(index))
+        if self.g[index] != self.rhs[index]:
+            heapq.heappush(self.heap, self._encode(index))
+
+    def update_edge(self, node1, node2):
+        """Avisa que cambió la pared entre dos celdas (ya editada en el grafo)."""
+        width = self.width
+        self._update(node1[1] * width + node1[0])
+        self._update(node2[1] * width + node2[0])
+
+    def set_passage(self, node1, node2, open_passage):
+        """Abre o cierra el pasaje entre dos celdas y actualiza la búsqueda."""
+        if open_passage:
+            self.graph.add_edge(node1, node2)
+        else:
+            self.graph.remove_edge(node1, node2)
+        self.update_edge(node1, node2)
+
+    def _top(self):
+        """Clave de la mejor entrada vigente del heap (descarta las obsoletas)."""
+        heap, total, g, rhs = self.heap, self.total, self.g, self.rhs
+        while heap:
+            entry = heap[0]
+            index = entry % total
+            if g[index] != rhs[index] and entry // total == self._key(index):
+                return entry // total
+            heapq.heappop(heap)
+        return None
+
+    def solve(self, progress=None, stats=None):
+        """
+        Lleva la búsqueda a un estado consistente y retorna ``(path, visited)``.
+
+        ``path`` queda vacío si no hay camino; ``visited`` son las celdas
+        expandidas en esta llamada (muy pocas tras una edición local). Si
+        ``progress`` interrumpe la búsqueda, el estado sigue siendo válido y
+        la próxima llamada continúa desde allí.
+        """
+        heap, total, g, rhs = self.heap, self.total, self.g, self.rhs
+        target = self._target
+        neighbors = self._neighbors
+        expanded = []
+
+        while True:
+            top = self._top()
+            if top is None or (top >= self._key(target) and rhs[target] == g[target]):
+                break
+            if progress is not None and expanded and not len(expanded) % PROGRESS_INTERVAL:
+                progress(len(expanded))
+            index = heapq.heappop(heap) % total
+            expanded.append(index)
+            if g[index] > rhs[index]:
+                g[index] = rhs[index]
+                for neighbor in neighbors(index):
+                    self._update(neighbor)
+            else:
+                g[index] = self.infinity
+                self._update(index)
+                for neighbor in neighbors(index):
+                    self._update(neighbor)
+
+        if stats is not None:
+            stats["nodes_expanded"] = len(expanded)
+            if g[target] < self.infinity:
+                stats["path_cost"] = g[target]
+        return self.path(), set(_to_nodes(expanded, self.width))
+
+    def path(self):
+        """Camino actual de la entrada a la salida siguiendo las distancias ``g``."""
+        g = self.g
+        current = self._target
+        if g[current] >= self.infinity:
+            return []
+        chain = [current]
+        while current != self._source:
+            current = min(self._neighbors(current), key=g.__getitem__)
+            chain.append(current)
+        chain.reverse()
+        return _to_nodes(chain, self.width)
@@ -0,0 +1,144 @@
+from model.algorithms import PROGRESS_INTERVAL, _add_extra_passages_fast, assign_entry_exit
+from model.graph import EAST, EAST_WALL, NORTH, SOUTH, SOUTH_WALL, WEST, GridGraph
+from model.instrumentation import measure
+from model.rng import make_rng
+
+
+def iter_rows_eller(width, height, rng=None, merge_chance=0.5, drop_chance=0.5):
+    """
+    Genera un laberinto perfecto fila por fila con el algoritmo de Eller.
+
+    Produce ``height`` filas; cada una es un ``bytearray`` de ``width``
+    códigos de pared (EAST_WALL | SOUTH_WALL, los del formato .maze). Solo se
+    guardan las etiquetas de conjunto de la fila actual, así que la memoria
+    es O(width) sin importar el alto.
+    """
+    rng = make_rng(rng)
+    rand = rng.random
+    # Etiqueta de cada celda: posición raíz de su conjunto en la fila anterior,
+    # o -1 si la celda empieza un conjunto nuevo.
+    labels = [-1] * width
+
+    for y in range(height):
+        last = y == height - 1
+        parent = list(range(width))
+
+        def find(cell):
+            while parent[cell] != cell:
+                parent[cell] = parent[parent[cell]]
+                cell = parent[cell]
+            return cell
+
+        # Celdas que heredan la misma etiqueta pertenecen al mismo conjunto
+        first = [-1] * width
+        for x, label in enumerate(labels):
+            if label >= 0:
+                if first[label] >= 0:
+                    parent[x] = first[label]
+                else:
+                    first[label] = x
+
+        row = bytearray([EAST_WALL | SOUTH_WALL]) * width
+
+        # Uniones horizontales (en la última fila se unen todos los conjuntos)
+        for x in range(width - 1):
+            root1, root2 = find(x), find(x + 1)
+            if root1 != root2 and (last or rand() < merge_chance):
+                parent[root2] = root1
+                row[x] &= ~EAST_WALL
+
+        if last:
+            yield row
+            return
+
+        # Bajadas: cada conjunto baja al menos por una celda. Para los que no
+        # bajan al azar se elige una celda por muestreo de reservorio.
+        roots = [find(x) for x in range(width)]
+        has_drop = bytearray(width)
+        seen = [0] * width
+        pick = [0] * width
+        labels = [-1] * width
+        for x, root in enumerate(roots):
+            seen[root] += 1
+            if rand() * seen[root] < 1:
+                pick[root] = x
+            if rand() < drop_chance:
+                has_drop[root] = 1
+                row[x] &= ~SOUTH_WALL
+                labels[x] = root
+        for x, root in enumerate(roots):
+            if root == x and not has_drop[root]:
+                cell = pick[root]
+                row[cell] &= ~SOUTH_WALL
+                labels[cell] = root
+
+        yield row
+
+
+def carve_rows(graph, rows, progress=None):
+    """
+    Aplica sobre el grafo las filas de códigos de pared de un generador.
+
+    ``progress(celdas)`` se llama cada unas ``PROGRESS_INTERVAL`` celdas
+    talladas; si lanza una excepción el tallado se interrumpe.
+    """
+    width = graph.width
+    passages = graph.passages if isinstance(graph, GridGraph) else None
+    opened = 0
+    rows_per_report = max(1, PROGRESS_INTERVAL // max(1, width))
+    for y, row in enumerate(rows):
+        if progress is not None and y and not y % rows_per_report:
+            progress(y * width)
+        base = y * width
+        for x, code in enumerate(row):
+            if not code & EAST_WALL:
+                if passages is not None:
+                    passages[base + x] |= EAST
+                    passages[base + x + 1] |= WEST
+                    opened += 1
+                else:
+                    graph.add_edge((x, y), (x + 1, y))
+            if not code & SOUTH_WALL:
+                if passages is not None:
+                    passages[base + x] |= SOUTH
+                    passages[base + x + width] |= NORTH
+                    opened += 1
+                else:
+                    graph.add_edge((x, y), (x, y + 1))
+    # Las filas se tallan sobre una cuadrícula nueva: cada pasaje es nuevo
+    if passages is not None:
+        graph.edge_count += opened
+
+
+def generate_maze_eller(graph, ratio=0.3, rng=None, progress=None, instrumentation=None):
+    """
+    Genera un laberinto con el algoritmo de Eller directamente sobre el grafo.
+
+    ``progress`` e ``instrumentation`` se comportan como en ``generate_maze_dfs``.
+    """
+    rng = make_rng(rng)
+    with measure(instrumentation, "carve", algorithm="Eller",
+                 width=graph.width, height=graph.height) as record:
+        carve_rows(graph, iter_rows_eller(graph.width, graph.height, rng=rng), progress)
+        record["cells_carved"] = graph.width * graph.height
+
+    with measure(instrumentation, "extra_passages", ratio=ratio) as record:
+        _add_extra_passages_fast(graph, ratio, rng, record)
+    assign_entry_exit(graph, rng=rng)
+
+
+def write_maze_eller(path, width, height, rng=None, seed=None):
+    """
+    Genera un laberinto de Eller y lo escribe en streaming a un archivo .maze.
+
+    Nunca tiene más de una fila en memoria. Entrada y salida se sortean de
+    antemano en los bordes izquierdo y derecho.
+    """
+    from model.maze_file import MazeRowWriter
+
+    rng = make_rng(rng if rng is not None else seed)
+    entry = (0, rng.randrange(height))
+    exit = (width - 1, rng.randrange(height))
+    with MazeRowWriter(path, width, entry=entry, exit=exit, seed=seed, algorithm="Eller") as writer:
+        for row in iter_rows_eller(width, height, rng=rng):
+            writer.write_row(row)
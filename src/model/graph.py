@@ -1,3 +1,6 @@
+from collections.abc import Mapping
+
+
 class Graph:
     """
     Representa directamente el laberinto como un grafo no dirigido.
@@ -11,6 +14,8 @@ class Graph:
         self.width = width
         self.height = height
         self.adjacency = {}     # Diccionario vació para almacenar conexiones
+        self.edge_count = 0     # Se mantiene al agregar aristas (sin recorrer el grafo)
+        self.costs = None       # Costo por celda (índice plano), o None si no hay terreno
         self.entry = None
         self.exit = None
 
@@ -30,9 +35,22 @@ class Graph:
         self.add_node(node2)
         if node2 not in self.adjacency[node1]:
             self.adjacency[node1].append(node2)
+            self.edge_count += 1
         if node1 not in self.adjacency[node2]:
             self.adjacency[node2].append(node1)
 
+    def remove_edge(self, node1, node2):
+        """Quita la arista entre dos nodos (levanta la pared), si existe."""
+        if node2 in self.adjacency.get(node1, []):
+            self.adjacency[node1].remove(node2)
+            self.edge_count -= 1
+        if node1 in self.adjacency.get(node2, []):
+            self.adjacency[node2].remove(node1)
+
+    def has_edge(self, node1, node2):
+        """Indica si existe pasaje entre dos nodos."""
+        return node2 in self.adjacency.get(node1, [])
+
     def neighbors(self, node):
         """
         Retorna la lista de nodos vecinos (celdas conectadas) de un nodo dado.
@@ -44,3 +62,184 @@ class Graph:
         Retorna una lista con todos los nodos (celdas) del grafo.
         """
         return list(self.adjacency.keys())
+
+
+# Bits de pasaje por celda: un bit activo indica que la pared en esa
+# dirección está derribada (hay pasaje hacia el vecino).
+NORTH = 1
+SOUTH = 2
+EAST = 4
+WEST = 8
+
+# Códigos de pared de 2 bits por celda usados por el formato .maze y por los
+# generadores por filas: solo se guardan las paredes este y sur de cada celda.
+EAST_WALL = 1
+SOUTH_WALL = 2
+
+# (dx, dy, bit propio, bit opuesto en el vecino)
+DIRECTIONS = (
+    (0, -1, NORTH, SOUTH),
+    (0, 1, SOUTH, NORTH),
+    (1, 0, EAST, WEST),
+    (-1, 0, WEST, EAST),
+)
+
+
+class _AdjacencyView(Mapping):
+    """
+    Vista de solo lectura que imita el diccionario ``Graph.adjacency``.
+
+    Las listas de vecinos se construyen al vuelo a partir de la máscara de
+    pasajes, así que no ocupan memoria mientras nadie las pida.
+    """
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __getitem__(self, node):
+        if not self._graph.contains(node):
+            raise KeyError(node)
+        return self._graph.neighbors(node)
+
+    def __iter__(self):
+        width, height = self._graph.width, self._graph.height
+        return ((x, y) for y in range(height) for x in range(width))
+
+    def __len__(self):
+        return self._graph.width * self._graph.height
+
+
+class GridGraph:
+    """
+    Laberinto rectangular almacenado como una máscara de pasajes por celda.
+
+    Cada celda ocupa un único byte en ``self.passages`` (índice plano
+    ``y * width + x``) con un bit por dirección (NORTH, SOUTH, EAST, WEST).
+    Expone la misma API que ``Graph`` (``add_edge``, ``neighbors``, ``nodes``
+    y ``adjacency``), por lo que generadores, solucionadores y la vista
+    funcionan sin cambios, pero la memoria baja a un byte por celda.
+
+    ``edge_count`` lleva la cantidad de pasajes; quien escriba ``passages``
+    directamente (los generadores en bloque) debe actualizarlo.
+    """
+
+    def __init__(self, width, height):
+        """
+        Inicializa una cuadrícula con todas las paredes levantadas.
+        """
+        self.width = width
+        self.height = height
+        self.passages = bytearray(width * height)
+        self.edge_count = 0
+        # Terreno opcional: costo de entrar a cada celda (ver model.weighted)
+        self.costs = None
+        self.entry = None
+        self.exit = None
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Construye una ``GridGraph`` equivalente a cualquier grafo del laberinto."""
+        grid = cls(graph.width, graph.height)
+        for node in graph.nodes():
+            for neighbor in graph.neighbors(node):
+                grid.add_edge(node, neighbor)
+        grid.entry = graph.entry
+        grid.exit = graph.exit
+        return grid
+
+    @property
+    def adjacency(self):
+        """Vista tipo diccionario ``{nodo: [vecinos]}`` compatible con ``Graph``."""
+        return _AdjacencyView(self)
+
+    def contains(self, node):
+        """Indica si la coordenada (x, y) está dentro de la cuadrícula."""
+        x, y = node
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def index(self, node):
+        """Convierte una coordenada (x, y) en su índice plano."""
+        return node[1] * self.width + node[0]
+
+    def node(self, index):
+        """Convierte un índice plano en su coordenada (x, y)."""
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def _direction(self, node1, node2):
+        """Retorna los bits (propio, opuesto) que unen dos celdas vecinas."""
+        dx = node2[0] - node1[0]
+        dy = node2[1] - node1[1]
+        for ddx, ddy, bit, opposite in DIRECTIONS:
+            if dx == ddx and dy == ddy:
+                return bit, opposite
+        raise ValueError(f"Las celdas {node1} y {node2} no son adyacentes.")
+
+    def add_node(self, node):
+        """
+        Compatibilidad con ``Graph``: todas las celdas existen desde el inicio.
+        """
+        if not self.contains(node):
+            raise ValueError(f"La celda {node} está fuera de la cuadrícula.")
+
+    def add_edge(self, node1, node2):
+        """Derriba la pared entre dos celdas vecinas (arista bidireccional)."""
+        self.add_node(node1)
+        self.add_node(node2)
+        bit, opposite = self._direction(node1, node2)
+        index = self.index(node1)
+        if not self.passages[index] & bit:
+            self.edge_count += 1
+        self.passages[index] |= bit
+        self.passages[self.index(node2)] |= opposite
+
+    def remove_edge(self, node1, node2):
+        """Levanta la pared entre dos celdas vecinas, si había pasaje."""
+        self.add_node(node1)
+        self.add_node(node2)
+        bit, opposite = self._direction(node1, node2)
+        index = self.index(node1)
+        if self.passages[index] & bit:
+            self.edge_count -= 1
+        self.passages[index] &= ~bit
+        self.passages[self.index(node2)] &= ~opposite
+
+    def has_edge(self, node1, node2):
+        """Indica si existe pasaje entre dos celdas."""
+        if not (self.contains(node1) and self.contains(node2)):
+            return False
+        try:
+            bit, _ = self._direction(node1, node2)
+        except ValueError:
+            return False
+        return bool(self.passages[self.index(node1)] & bit)
+
+    def neighbors(self, node):
+        """
+        Retorna la lista de nodos vecinos (celdas conectadas) de un nodo dado.
+        """
+        if not self.contains(node):
+            return []
+        x, y = node
+        mask = self.passages[y * self.width + x]
+        return [(x + dx, y + dy) for dx, dy, bit, _ in DIRECTIONS if mask & bit]
+
+    def neighbor_indices(self, index):
+        """Versión de ``neighbors`` sobre índices planos, sin crear tuplas."""
+        mask = self.passages[index]
+        result = []
+        if mask & NORTH:
+            result.append(index - self.width)
+        if mask & SOUTH:
+            result.append(index + self.width)
+        if mask & EAST:
+            result.append(index + 1)
+        if mask & WEST:
+            result.append(index - 1)
+        return result
+
+    def nodes(self):
+        """
+        Retorna una lista con todos los nodos (celdas) del grafo.
+        """
+        return [(x, y) for y in range(self.height) for x in range(self.width)]
@@ -0,0 +1,114 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+# Nombres para mostrar de fases y contadores
+LABELS = {
+    "carve": "tallado",
+    "extra_passages": "pasajes extra",
+    "solve": "resolución",
+    "repair": "reparación",
+    "render": "dibujo",
+    "analyze": "análisis",
+    "cells_carved": "celdas talladas",
+    "passages_added": "pasajes abiertos",
+    "nodes_expanded": "nodos expandidos",
+    "heap_pushes": "inserciones en heap",
+    "heap_pops": "extracciones de heap",
+    "path_cost": "costo del camino",
+    "canvas_items": "ítems de canvas creados",
+    "cells": "celdas",
+    "passages": "pasajes",
+    "dead_ends": "callejones",
+    "corridors": "pasillos",
+    "junctions": "cruces",
+    "reachable": "celdas alcanzables",
+    "solution_length": "pasos de la solución",
+    "diameter": "diámetro",
+}
+
+
+class Instrumentation:
+    """
+    Registro de fases medidas (generación, pasajes extra, resolución, dibujo).
+
+    Cada fase produce un registro plano ``{"phase": ..., "seconds": ...,
+    contadores...}``. Los algoritmos reciben el diccionario del registro como
+    ``stats`` y escriben allí sus contadores, así que medir no agrega
+    recorridos extra. Se conservan los últimos ``max_records`` registros.
+    """
+
+    def __init__(self, max_records=1000):
+        """Crea un registro vacío."""
+        self.records = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name, **fields):
+        """
+        Mide una fase; entrega el registro para que se le agreguen contadores.
+
+        El registro se guarda incluso si la fase termina con una excepción
+        (por ejemplo, una cancelación), marcado con ``"error"``.
+        """
+        record = {"phase": name, **fields}
+        started = time.perf_counter()
+        try:
+            yield record
+        except BaseException as error:
+            record["error"] = type(error).__name__
+            raise
+        finally:
+            record["seconds"] = time.perf_counter() - started
+            with self._lock:
+                self.records.append(record)
+
+    def last(self, name):
+        """Último registro de la fase ``name``, o ``None``."""
+        with self._lock:
+            for record in reversed(self.records):
+                if record["phase"] == name:
+                    return record
+        return None
+
+    def export(self, path):
+        """Guarda todos los registros como una lista JSON."""
+        import json  # solo quien exporta paga la importación
+
+        with self._lock:
+            records = list(self.records)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(records, file, indent=2)
+
+    def clear(self):
+        """Descarta los registros."""
+        with self._lock:
+            self.records.clear()
+
+
+def measure(instrumentation, name, **fields):
+    """
+    ``instrumentation.phase(name, ...)`` o, sin instrumentación, un contexto
+    que entrega un diccionario descartable: los algoritmos escriben sus
+    contadores igual y no necesitan distinguir los dos casos.
+    """
+    if instrumentation is None:
+        return nullcontext({})
+    return instrumentation.phase(name, **fields)
+
+
+def describe(record):
+    """Resumen corto de un registro para la etiqueta de información."""
+    if record is None:
+        return ""
+    text = f"{LABELS.get(record['phase'], record['phase'])} {record['seconds'] * 1000:.0f} ms"
+    counters = [
+        f"{value} {LABELS.get(key, key)}"
+        for key, value in record.items()
+        if key not in ("phase", "seconds", "algorithm", "width", "height", "error")
+        and isinstance(value, int)
+    ]
+    if counters:
+        text += f" ({', '.join(counters)})"
+    return text
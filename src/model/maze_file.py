@@ -0,0 +1,272 @@
+import mmap
+import struct
+
+import numpy as np
+
+from model.graph import (
+    EAST, EAST_WALL, NORTH, SOUTH, SOUTH_WALL, WEST, GridGraph, _AdjacencyView
+)
+
+# Formato binario .maze
+#
+#   cabecera (64 bytes, little-endian):
+#     magic "MAZE", versión, banderas, ancho, alto,
+#     entrada (x, y), salida (x, y)  (-1 si no hay),
+#     semilla (uint64, válida si FLAG_SEED), algoritmo (16 bytes ASCII)
+#   mapa de paredes: 2 bits por celda en orden plano y * width + x,
+#     bit 0 = pared este, bit 1 = pared sur (1 = pared levantada),
+#     4 celdas por byte empezando por los bits menos significativos.
+MAGIC = b"MAZE"
+VERSION = 1
+FLAG_SEED = 1
+HEADER = struct.Struct("<4sHHIIiiiiQ16s")
+HEADER_SIZE = 64
+
+
+def _encode_point(point):
+    return point if point is not None else (-1, -1)
+
+
+def _decode_point(x, y):
+    return (x, y) if x >= 0 else None
+
+
+def _pack_header(width, height, entry=None, exit=None, seed=None, algorithm=""):
+    """Construye la cabecera de 64 bytes."""
+    entry_x, entry_y = _encode_point(entry)
+    exit_x, exit_y = _encode_point(exit)
+    header = HEADER.pack(
+        MAGIC, VERSION, FLAG_SEED if seed is not None else 0,
+        width, height,
+        entry_x, entry_y, exit_x, exit_y,
+        seed if seed is not None else 0,
+        algorithm.encode("ascii")[:16],
+    )
+    return header.ljust(HEADER_SIZE, b"\0")
+
+
+def _pack_codes(codes):
+    """Empaqueta códigos de pared de 2 bits (4 celdas por byte)."""
+    padded = np.zeros(-(-codes.size // 4) * 4, dtype=np.uint8)
+    padded[:codes.size] = codes
+    quads = padded.reshape(-1, 4)
+    packed = quads[:, 0] | (quads[:, 1] << 2) | (quads[:, 2] << 4) | (quads[:, 3] << 6)
+    return packed.tobytes()
+
+
+def pack_walls(graph):
+    """
+    Empaqueta las paredes este/sur de un grafo en 2 bits por celda.
+
+    Las paredes del borde derecho e inferior siempre se marcan como
+    levantadas. Retorna los bytes del mapa de paredes.
+    """
+    if not isinstance(graph, GridGraph):
+        graph = GridGraph.from_graph(graph)
+    width, height = graph.width, graph.height
+    passages = np.frombuffer(graph.passages, dtype=np.uint8).reshape(height, width)
+
+    codes = np.zeros((height, width), dtype=np.uint8)
+    codes[(passages & EAST) == 0] |= EAST_WALL
+    codes[(passages & SOUTH) == 0] |= SOUTH_WALL
+    codes[:, -1] |= EAST_WALL
+    codes[-1, :] |= SOUTH_WALL
+
+    return _pack_codes(codes.ravel())
+
+
+def save_maze(graph, path, seed=None, algorithm=""):
+    """Guarda el laberinto en formato binario .maze."""
+    header = _pack_header(graph.width, graph.height, graph.entry, graph.exit, seed, algorithm)
+    with open(path, "wb") as file:
+        file.write(header)
+        file.write(pack_walls(graph))
+
+
+class MazeRowWriter:
+    """
+    Escribe un archivo .maze fila por fila, sin tener el laberinto en memoria.
+
+    Cada fila es una secuencia de ``width`` códigos de pared (EAST_WALL |
+    SOUTH_WALL), como los que produce ``model.eller.iter_rows_eller``. El
+    alto se escribe en la cabecera al cerrar, según las filas recibidas.
+    """
+
+    def __init__(self, path, width, entry=None, exit=None, seed=None, algorithm=""):
+        """Abre el archivo y reserva la cabecera."""
+        self.width = width
+        self.rows = 0
+        self.entry = entry
+        self.exit = exit
+        self.seed = seed
+        self.algorithm = algorithm
+        self._pending = bytearray()
+        self._file = open(path, "wb")
+        self._file.write(bytes(HEADER_SIZE))
+
+    def write_row(self, codes):
+        """Agrega una fila de códigos de pared."""
+        if len(codes) != self.width:
+            raise ValueError(f"Se esperaban {self.width} celdas, llegaron {len(codes)}.")
+        self._pending += codes
+        complete = len(self._pending) & ~3
+        if complete:
+            block = np.frombuffer(bytes(self._pending[:complete]), dtype=np.uint8)
+            self._file.write(_pack_codes(block))
+            del self._pending[:complete]
+        self.rows += 1
+
+    def close(self):
+        """Vuelca las celdas pendientes y completa la cabecera."""
+        if self._file.closed:
+            return
+        if self._pending:
+            self._file.write(_pack_codes(np.frombuffer(bytes(self._pending), dtype=np.uint8)))
+            self._pending.clear()
+        self._file.seek(0)
+        self._file.write(_pack_header(self.width, self.rows, self.entry, self.exit,
+                                      self.seed, self.algorithm))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_maze(path):
+    """Abre un archivo .maze mapeado en memoria (sin copiar el mapa de paredes)."""
+    return MappedMaze(path)
+
+
+class MappedMaze:
+    """
+    Laberinto de solo lectura respaldado por un archivo .maze vía ``mmap``.
+
+    Expone la API de lectura de ``GridGraph`` (``neighbors``,
+    ``neighbor_indices``, ``nodes``, ``adjacency``), leyendo cada pared
+    directamente del mapa: el sistema operativo solo carga las páginas
+    que el solucionador realmente toca.
+    """
+
+    def __init__(self, path):
+        """Mapea el archivo y lee la cabecera."""
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            self._file.close()
+            raise
+
+        if len(self._mmap) < HEADER_SIZE:
+            self.close()
+            raise ValueError(f"'{path}' no es un archivo de laberinto válido.")
+        (magic, version, flags, width, height,
+         entry_x, entry_y, exit_x, exit_y, seed, algorithm) = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"'{path}' no es un archivo de laberinto válido.")
+        if len(self._mmap) < HEADER_SIZE + -(-width * height // 4):
+            self.close()
+            raise ValueError(f"'{path}' está truncado.")
+
+        self.width = width
+        self.height = height
+        self.entry = _decode_point(entry_x, entry_y)
+        self.exit = _decode_point(exit_x, exit_y)
+        self.seed = seed if flags & FLAG_SEED else None
+        self.algorithm = algorithm.rstrip(b"\0").decode("ascii")
+
+    def close(self):
+        """Libera el mapeo y el archivo."""
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _walls(self, index):
+        """Retorna los 2 bits de pared (este, sur) de una celda."""
+        return (self._mmap[HEADER_SIZE + (index >> 2)] >> ((index & 3) * 2)) & 3
+
+    @property
+    def adjacency(self):
+        """Vista tipo diccionario ``{nodo: [vecinos]}`` compatible con ``Graph``."""
+        return _AdjacencyView(self)
+
+    def contains(self, node):
+        """Indica si la coordenada (x, y) está dentro de la cuadrícula."""
+        x, y = node
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def index(self, node):
+        """Convierte una coordenada (x, y) en su índice plano."""
+        return node[1] * self.width + node[0]
+
+    def node(self, index):
+        """Convierte un índice plano en su coordenada (x, y)."""
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def neighbor_indices(self, index):
+        """Vecinos conectados de una celda, como índices planos."""
+        width = self.width
+        result = []
+        if index >= width and not self._walls(index - width) & SOUTH_WALL:
+            result.append(index - width)
+        walls = self._walls(index)
+        if index < width * (self.height - 1) and not walls & SOUTH_WALL:
+            result.append(index + width)
+        x = index % width
+        if x < width - 1 and not walls & EAST_WALL:
+            result.append(index + 1)
+        if x > 0 and not self._walls(index - 1) & EAST_WALL:
+            result.append(index - 1)
+        return result
+
+    def neighbors(self, node):
+        """
+        Retorna la lista de nodos vecinos (celdas conectadas) de un nodo dado.
+        """
+        if not self.contains(node):
+            return []
+        width = self.width
+        return [divmod(i, width)[::-1] for i in self.neighbor_indices(self.index(node))]
+
+    def nodes(self):
+        """
+        Retorna una lista con todos los nodos (celdas) del grafo.
+        """
+        return [(x, y) for y in range(self.height) for x in range(self.width)]
+
+    def to_grid_graph(self):
+        """Copia el laberinto a una ``GridGraph`` editable en memoria."""
+        width, height = self.width, self.height
+        total = width * height
+        packed = np.frombuffer(self._mmap, dtype=np.uint8,
+                               count=-(-total // 4), offset=HEADER_SIZE)
+        codes = np.stack([(packed >> shift) & 3 for shift in (0, 2, 4, 6)], axis=1)
+        codes = codes.ravel()[:total].reshape(height, width)
+        del packed
+
+        east = (codes & EAST_WALL) == 0
+        south = (codes & SOUTH_WALL) == 0
+        east[:, -1] = False
+        south[-1, :] = False
+
+        passages = np.zeros((height, width), dtype=np.uint8)
+        passages[east] |= EAST
+        passages[:, 1:][east[:, :-1]] |= WEST
+        passages[south] |= SOUTH
+        passages[1:, :][south[:-1, :]] |= NORTH
+
+        graph = GridGraph(width, height)
+        graph.passages[:] = passages.tobytes()
+        graph.edge_count = int(np.count_nonzero(east)) + int(np.count_nonzero(south))
+        graph.entry = self.entry
+        graph.exit = self.exit
+        return graph
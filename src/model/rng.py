@@ -0,0 +1,42 @@
+import hashlib
+import random
+
+
+def make_rng(seed=None):
+    """
+    Retorna un generador ``random.Random`` propio.
+
+    ``seed`` puede ser un entero (flujo reproducible), ``None`` (semilla del
+    sistema) o un ``random.Random`` existente, que se retorna tal cual para
+    que varias funciones compartan el mismo flujo.
+    """
+    if isinstance(seed, random.Random):
+        return seed
+    return random.Random(seed)
+
+
+def spawn_seeds(seed, count):
+    """
+    Deriva ``count`` semillas hijas independientes de una semilla base.
+
+    Cada hija se obtiene con BLAKE2b sobre (semilla, índice), así que el
+    reparto no depende del orden ni del proceso que la consuma: el trabajo
+    ``i`` de un lote distribuido siempre recibe el mismo flujo.
+
+    ``seed`` se reduce antes a un entero: ``None`` sortea uno nuevo y un
+    ``random.Random`` aporta 64 bits de su flujo (su ``repr`` incluye una
+    dirección de memoria y no es reproducible). Otros tipos lanzan
+    ``TypeError``.
+    """
+    if not isinstance(seed, int):
+        seed = make_rng(seed).getrandbits(64)
+    children = []
+    for index in range(count):
+        digest = hashlib.blake2b(f"{seed}:{index}".encode("ascii"), digest_size=8).digest()
+        children.append(int.from_bytes(digest, "little"))
+    return children
+
+
+def spawn_rngs(seed, count):
+    """Crea ``count`` generadores independientes a partir de una semilla base."""
+    return [random.Random(child) for child in spawn_seeds(seed, count)]
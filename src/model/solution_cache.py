@@ -0,0 +1,98 @@
+import hashlib
+from collections import OrderedDict
+
+
+def maze_fingerprint(graph):
+    """
+    Huella barata del laberinto: BLAKE2b de las dimensiones, las paredes y,
+    si hay terreno, los costos por celda.
+
+    Sobre ``GridGraph`` es un solo hash lineal sobre un byte por celda. Para
+    otros grafos se recorren las listas de adyacencia en orden de celdas.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{graph.width}x{graph.height}".encode("ascii"))
+    passages = getattr(graph, "passages", None)
+    if passages is not None:
+        digest.update(passages)
+    else:
+        for y in range(graph.height):
+            for x in range(graph.width):
+                neighbors = sorted(graph.neighbors((x, y)))
+                digest.update(repr(neighbors).encode("ascii"))
+    costs = getattr(graph, "costs", None)
+    if costs is not None:
+        digest.update(b"costs")
+        digest.update(costs)
+    return digest.hexdigest()
+
+
+class SolutionCache:
+    """
+    Caché LRU acotada de soluciones ``(path, visited)``.
+
+    La clave es (huella del laberinto, inicio, fin, algoritmo). No depende de
+    la interfaz gráfica: la usan tanto el controlador como los modos sin
+    ventana. Cuando el laberinto cambia hay que llamar a ``invalidate``.
+    """
+
+    def __init__(self, maxsize=32):
+        """Crea una caché vacía de hasta ``maxsize`` soluciones."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Retorna la solución guardada para ``key`` o ``None``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, path, visited):
+        """
+        Guarda una solución, descartando la menos usada si no hay lugar.
+
+        Los visitados se guardan como tupla para conservar el orden de
+        expansión, que es el que se anima al mostrar la solución.
+        """
+        self._entries[key] = (tuple(path), tuple(visited))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def solve(self, graph, start, end, algorithm, solver, fingerprint=None):
+        """
+        Retorna la solución cacheada o la calcula con ``solver`` y la guarda.
+
+        ``fingerprint`` permite reutilizar una huella ya calculada para no
+        recorrer el laberinto en cada consulta.
+        """
+        if fingerprint is None:
+            fingerprint = maze_fingerprint(graph)
+        key = (fingerprint, start, end, algorithm)
+        entry = self.get(key)
+        if entry is not None:
+            return list(entry[0]), entry[1]
+        path, visited = solver(graph, start, end)
+        self.put(key, path, visited)
+        return path, visited
+
+    def invalidate(self, fingerprint=None):
+        """Descarta las soluciones de un laberinto, o todas si no se indica."""
+        if fingerprint is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == fingerprint]:
+            del self._entries[key]
+
+    def stats(self):
+        """Contadores de uso de la caché."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
@@ -0,0 +1,273 @@
+import heapq
+from array import array
+
+from model.graph import _AdjacencyView
+
+
+def neighbor_function(graph):
+    """
+    Retorna una función ``índice -> [índices vecinos]`` para cualquier grafo.
+
+    Usa ``graph.neighbor_indices`` cuando existe (``GridGraph``,
+    ``MappedMaze``, ``PrunedGraph``) y si no traduce desde ``neighbors``.
+    """
+    if hasattr(graph, "neighbor_indices"):
+        return graph.neighbor_indices
+
+    width = graph.width
+
+    def neighbor_indices(index):
+        node = (index % width, index // width)
+        return [y * width + x for x, y in graph.neighbors(node)]
+
+    return neighbor_indices
+
+
+def _to_nodes(indices, width):
+    return [(index % width, index // width) for index in indices]
+
+
+def _chain(parent, index):
+    """Recorre ``parent`` desde ``index`` hasta la raíz (valor -1)."""
+    chain = []
+    while index != -1:
+        chain.append(index)
+        index = parent[index]
+    return chain
+
+
+def solve_maze_bidirectional_bfs(graph, start, end):
+    """
+    Resuelve el laberinto con BFS desde ambos extremos a la vez.
+
+    En cada paso se expande el nivel completo del frente más pequeño; el
+    primer contacto entre ambas búsquedas da un camino mínimo. Retorna
+    ``(path, visited)`` como ``solve_maze_bfs``.
+    """
+    width = graph.width
+    total = width * graph.height
+    neighbors = neighbor_function(graph)
+    source = start[1] * width + start[0]
+    target = end[1] * width + end[0]
+    if source == target:
+        return [start], {start}
+
+    # side: 0 = sin visitar, 1 = desde la entrada, 2 = desde la salida.
+    # Cada celda pertenece a un único lado, así que comparten ``parent``.
+    side = bytearray(total)
+    parent = array("i" if total < 2 ** 31 else "q", [-1]) * total
+    side[source] = 1
+    side[target] = 2
+    touched = [source, target]
+    forward, backward = [source], [target]
+    meet = None
+
+    while forward and backward and meet is None:
+        if len(forward) <= len(backward):
+            frontier, mine, other = forward, 1, 2
+        else:
+            frontier, mine, other = backward, 2, 1
+
+        next_frontier = []
+        for current in frontier:
+            for neighbor in neighbors(current):
+                owner = side[neighbor]
+                if owner == 0:
+                    side[neighbor] = mine
+                    parent[neighbor] = current
+                    next_frontier.append(neighbor)
+                    touched.append(neighbor)
+                elif owner == other:
+                    meet = (current, neighbor) if mine == 1 else (neighbor, current)
+                    break
+            if meet is not None:
+                break
+
+        if mine == 1:
+            forward = next_frontier
+        else:
+            backward = next_frontier
+
+    visited = set(_to_nodes(touched, width))
+    if meet is None:
+        return [], visited
+
+    path = _chain(parent, meet[0])
+    path.reverse()
+    path.extend(_chain(parent, meet[1]))
+    return _to_nodes(path, width), visited
+
+
+def solve_maze_bidirectional_astar(graph, start, end):
+    """
+    Resuelve el laberinto con A* bidireccional de potenciales promediados.
+
+    Ambas direcciones usan el potencial ``(h_salida - h_entrada) / 2`` (con
+    distancias Manhattan), que deja los costos reducidos idénticos en los dos
+    sentidos: es un Dijkstra bidireccional sobre el grafo reponderado, y se
+    detiene cuando la suma de los dos topes ya no puede mejorar el mejor
+    camino. Las claves del heap son enteros ``clave * total + índice`` y
+    toda la contabilidad vive en arreglos planos.
+    """
+    width = graph.width
+    total = width * graph.height
+    neighbors = neighbor_function(graph)
+    source = start[1] * width + start[0]
+    target = end[1] * width + end[0]
+    if source == target:
+        return [start], {start}
+
+    infinity = total + 1
+    typecode = "i" if total < 2 ** 31 else "q"
+    g_forward = array(typecode, [infinity]) * total
+    g_backward = array(typecode, [infinity]) * total
+    parent_forward = array(typecode, [-1]) * total
+    parent_backward = array(typecode, [-1]) * total
+    closed = bytearray(total)
+
+    sx, sy = start
+    tx, ty = end
+    span = abs(sx - tx) + abs(sy - ty)
+
+    # Clave duplicada para trabajar con enteros:
+    #   2 * g + signo * (h_salida - h_entrada) + span  (siempre >= 0)
+    g_forward[source] = 0
+    g_backward[target] = 0
+    heap_forward = [2 * span * total + source]
+    heap_backward = [2 * span * total + target]
+    heappush, heappop = heapq.heappush, heapq.heappop
+    best = infinity
+    meet = None
+    expanded = []
+
+    while heap_forward and heap_backward:
+        if heap_forward[0] // total + heap_backward[0] // total >= 2 * (best + span):
+            break
+
+        # Principio de cardinalidad: se expande el frente con menos nodos abiertos
+        if len(heap_forward) <= len(heap_backward):
+            heap, g, g_other, parent, sign, bit = (
+                heap_forward, g_forward, g_backward, parent_forward, 1, 1
+            )
+        else:
+            heap, g, g_other, parent, sign, bit = (
+                heap_backward, g_backward, g_forward, parent_backward, -1, 2
+            )
+
+        current = heappop(heap) % total
+        if closed[current] & bit:
+            continue
+        closed[current] |= bit
+        expanded.append(current)
+
+        tentative = g[current] + 1
+        for neighbor in neighbors(current):
+            if tentative < g[neighbor]:
+                g[neighbor] = tentative
+                parent[neighbor] = current
+                y, x = divmod(neighbor, width)
+                potential = abs(x - tx) + abs(y - ty) - abs(x - sx) - abs(y - sy)
+                heappush(heap, (2 * tentative + sign * potential + span) * total + neighbor)
+            other = g_other[neighbor]
+            if other < infinity and tentative + other < best:
+                best = tentative + other
+                meet = (current, neighbor) if bit == 1 else (neighbor, current)
+
+    visited = set(_to_nodes(expanded, width))
+    if meet is None:
+        return [], visited
+
+    path = _chain(parent_forward, meet[0])
+    path.reverse()
+    path.extend(_chain(parent_backward, meet[1]))
+    return _to_nodes(path, width), visited
+
+
+def fill_dead_ends(graph, keep=()):
+    """
+    Rellena callejones sin salida: elimina repetidamente las celdas de grado
+    uno (o cero) que no estén en ``keep``.
+
+    Retorna un ``bytearray`` con 1 para las celdas que sobreviven. En un
+    laberinto perfecto solo queda el camino entre las celdas de ``keep``.
+    """
+    width = graph.width
+    total = width * graph.height
+    neighbors = neighbor_function(graph)
+    protected = {y * width + x for x, y in keep}
+
+    degree = bytearray(len(neighbors(index)) for index in range(total))
+    alive = bytearray(b"\x01") * total
+    stack = [index for index in range(total) if degree[index] <= 1 and index not in protected]
+
+    while stack:
+        current = stack.pop()
+        if not alive[current]:
+            continue
+        alive[current] = 0
+        for neighbor in neighbors(current):
+            if alive[neighbor]:
+                degree[neighbor] -= 1
+                if degree[neighbor] == 1 and neighbor not in protected:
+                    stack.append(neighbor)
+
+    return alive
+
+
+class PrunedGraph:
+    """
+    Vista de un grafo del que se ocultan las celdas podadas.
+
+    Ofrece la misma API de lectura que ``GridGraph``, así que cualquier
+    solucionador (incluidos ``solve_maze_bfs`` y ``solve_maze_astar``)
+    puede ejecutarse sobre el espacio de búsqueda reducido.
+    """
+
+    def __init__(self, graph, alive):
+        """Envuelve ``graph`` conservando solo las celdas con ``alive`` activo."""
+        self.graph = graph
+        self.alive = alive
+        self.width = graph.width
+        self.height = graph.height
+        self.entry = graph.entry
+        self.exit = graph.exit
+        self._neighbors = neighbor_function(graph)
+
+    @property
+    def adjacency(self):
+        """Vista tipo diccionario ``{nodo: [vecinos]}`` compatible con ``Graph``."""
+        return _AdjacencyView(self)
+
+    def contains(self, node):
+        """Indica si la coordenada (x, y) está dentro de la cuadrícula."""
+        x, y = node
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def neighbor_indices(self, index):
+        """Vecinos vivos de una celda, como índices planos."""
+        if not self.alive[index]:
+            return []
+        alive = self.alive
+        return [neighbor for neighbor in self._neighbors(index) if alive[neighbor]]
+
+    def neighbors(self, node):
+        """
+        Retorna la lista de nodos vecinos (celdas conectadas) de un nodo dado.
+        """
+        if not self.contains(node):
+            return []
+        width = self.width
+        return _to_nodes(self.neighbor_indices(node[1] * width + node[0]), width)
+
+    def nodes(self):
+        """
+        Retorna una lista con las celdas que sobrevivieron a la poda.
+        """
+        width = self.width
+        return [(index % width, index // width)
+                for index, flag in enumerate(self.alive) if flag]
+
+
+def prune_dead_ends(graph, start, end):
+    """Retorna una ``PrunedGraph`` con los callejones sin salida rellenados."""
+    return PrunedGraph(graph, fill_dead_ends(graph, keep=(start, end)))
@@ -0,0 +1,195 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from model.algorithms import assign_entry_exit, carve_maze_dfs
+from model.graph import EAST, SOUTH, GridGraph
+from model.rng import make_rng, spawn_seeds
+from model.vectorized import (
+    ArrayDisjointSet, as_generator, kruskal_spanning_tree, open_passages
+)
+
+# Algoritmos para el árbol de cada tesela
+TILE_ALGORITHMS = ("kruskal", "dfs")
+# Celdas por lote al sortear los pasajes extra (acota la memoria temporal)
+_EXTRA_BAND_CELLS = 1 << 22
+
+
+def tile_bounds(width, height, tile):
+    """Rectángulos ``(x0, y0, x1, y1)`` de las teselas, por filas."""
+    return [
+        (x0, y0, min(x0 + tile, width), min(y0 + tile, height))
+        for y0 in range(0, height, tile)
+        for x0 in range(0, width, tile)
+    ]
+
+
+def carve_tile(job):
+    """
+    Genera el árbol de expansión de una tesela en un proceso del pool.
+
+    Recibe ``(ancho, alto, algoritmo, semilla)`` y retorna la máscara de
+    pasajes de la tesela como ``bytes``: ningún bit apunta fuera de ella.
+    """
+    width, height, algorithm, seed = job
+    tile = GridGraph(width, height)
+    if algorithm == "dfs":
+        carve_maze_dfs(tile, rng=seed)
+    else:
+        open_passages(tile, *kruskal_spanning_tree(width, height, seed))
+    return bytes(tile.passages)
+
+
+def boundary_edges(width, height, tile):
+    """
+    Aristas que cruzan de una tesela a otra, como arreglos ``(a, b)``.
+
+    ``b`` está a la derecha o debajo de ``a``, como en ``grid_edges``.
+    Solo se construyen las líneas de borde, nunca un arreglo por celda.
+    """
+    dtype = np.int32 if width * height < 2 ** 31 else np.int64
+    rows = np.arange(height, dtype=dtype) * width
+    columns = np.arange(width, dtype=dtype)
+    a = [rows + (x - 1) for x in range(tile, width, tile)]
+    b = [column + 1 for column in a]
+    below = [columns + (y - 1) * width for y in range(tile, height, tile)]
+    a += below
+    b += [row + width for row in below]
+    if not a:
+        empty = np.empty(0, dtype=dtype)
+        return empty, empty
+    return np.concatenate(a), np.concatenate(b)
+
+
+def stitch_tiles(graph, tile, rng=None):
+    """
+    Une las teselas con un Kruskal sobre las aristas de borde solamente.
+
+    Como cada tesela ya es un árbol, el union-find trabaja sobre teselas y
+    no sobre celdas: se abren exactamente ``teselas - 1`` pasajes y el
+    resultado sigue siendo un laberinto perfecto. Retorna cuántos se abrieron.
+    """
+    rng = as_generator(rng)
+    width, height = graph.width, graph.height
+    columns = -(-width // tile)
+    tiles = columns * -(-height // tile)
+    a, b = boundary_edges(width, height, tile)
+    order = rng.permutation(a.size)
+    a, b = a[order], b[order]
+
+    tile_a = (a // width // tile) * columns + (a % width) // tile
+    tile_b = (b // width // tile) * columns + (b % width) // tile
+    ds = ArrayDisjointSet(tiles)
+    chosen = np.zeros(a.size, dtype=bool)
+    remaining = tiles - 1
+    for i, (u, v) in enumerate(zip(tile_a.tolist(), tile_b.tolist())):
+        if remaining == 0:
+            break
+        if ds.union(u, v):
+            chosen[i] = True
+            remaining -= 1
+
+    open_passages(graph, a[chosen], b[chosen])
+    return int(chosen.sum())
+
+
+def add_extra_passages_banded(graph, ratio, rng=None):
+    """
+    Como ``add_extra_passages_batched`` pero por franjas de filas.
+
+    Cada franja sortea su parte de los pasajes (la misma distribución
+    uniforme sobre paredes derechas e inferiores), así que la memoria
+    temporal no crece con el tamaño del laberinto. Retorna cuántos pasajes
+    nuevos se abrieron.
+    """
+    rng = as_generator(rng)
+    width, height = graph.width, graph.height
+    if ratio <= 0 or width < 2 or height < 2:
+        return 0
+    passages = np.frombuffer(graph.passages, dtype=np.uint8)
+    rows = max(1, _EXTRA_BAND_CELLS // width)
+    opened = 0
+
+    for y0 in range(0, height - 1, rows):
+        y1 = min(y0 + rows, height - 1)
+        count = int(width * (y1 - y0) * ratio)
+        x = rng.integers(0, width - 1, size=count)
+        y = rng.integers(y0, y1, size=count)
+        vertical = rng.integers(0, 2, size=count)
+
+        # Clave única por pared: celda * 2 + (0 = derecha, 1 = abajo). Un
+        # arreglo de marcas descarta repetidos sin ordenar (np.unique ordena).
+        marks = np.zeros(width * (y1 - y0) * 2, dtype=bool)
+        marks[((y - y0) * width + x) * 2 + vertical] = True
+        keys = np.flatnonzero(marks) + y0 * width * 2
+        a = keys >> 1
+        vertical = (keys & 1).astype(bool)
+        closed = (passages[a] & np.where(vertical, SOUTH, EAST)) == 0
+        a, vertical = a[closed], vertical[closed]
+        open_passages(graph, a, np.where(vertical, a + width, a + 1))
+        opened += int(a.size)
+    return opened
+
+
+def generate_maze_tiled(graph, tile=512, ratio=0.3, rng=None, workers=None,
+                        algorithm="kruskal", progress=None):
+    """
+    Genera un laberinto gigante por teselas en varios procesos.
+
+    1. Cada tesela de ``tile`` x ``tile`` celdas recibe su propio árbol de
+       expansión (``algorithm``: Kruskal vectorizado o DFS) en un proceso
+       del pool, con una semilla derivada de ``rng``.
+    2. Las máscaras se copian a ``graph.passages`` a medida que llegan.
+    3. ``stitch_tiles`` une las teselas; el laberinto queda perfecto.
+    4. Se agregan los pasajes extra (``ratio``) y la entrada y salida.
+
+    ``graph`` debe ser una ``GridGraph`` con todas las paredes. Con
+    ``workers=1`` todo corre en el proceso actual. ``progress`` recibe las
+    celdas ya talladas después de cada tesela.
+    """
+    if not isinstance(graph, GridGraph):
+        raise ValueError("La generación por teselas requiere una GridGraph.")
+    if algorithm not in TILE_ALGORITHMS:
+        raise ValueError(f"Algoritmo '{algorithm}' no soportado por teselas.")
+    if tile < 2:
+        raise ValueError("Las teselas deben tener al menos 2 celdas de lado.")
+    # Las semillas de las teselas salen de un entero: así el resultado no
+    # depende del tipo de ``rng`` ni de cuántos procesos haya.
+    if isinstance(rng, np.random.Generator):
+        rng = int(rng.integers(2 ** 63))
+    elif not isinstance(rng, int):
+        rng = make_rng(rng).getrandbits(64)
+
+    width, height = graph.width, graph.height
+    bounds = tile_bounds(width, height, tile)
+    seeds = spawn_seeds(rng, len(bounds) + 2)
+    jobs = [(x1 - x0, y1 - y0, algorithm, seed) for (x0, y0, x1, y1), seed in zip(bounds, seeds)]
+    grid = np.frombuffer(graph.passages, dtype=np.uint8).reshape(height, width)
+    carved = 0
+
+    def paste(index, mask):
+        nonlocal carved
+        x0, y0, x1, y1 = bounds[index]
+        grid[y0:y1, x0:x1] = np.frombuffer(mask, dtype=np.uint8).reshape(y1 - y0, x1 - x0)
+        carved += (x1 - x0) * (y1 - y0)
+        if progress is not None:
+            progress(carved)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) == 1:
+        for index, job in enumerate(jobs):
+            paste(index, carve_tile(job))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(carve_tile, job): index for index, job in enumerate(jobs)}
+            for future in as_completed(futures):
+                paste(futures.pop(future), future.result())
+
+    # Cada tesela es un árbol: celdas - 1 pasajes por tesela
+    graph.edge_count = width * height - len(bounds)
+    stitch_tiles(graph, tile, rng=seeds[-2])
+    extra = as_generator(seeds[-1])
+    add_extra_passages_banded(graph, ratio, rng=extra)
+    assign_entry_exit(graph, rng=int(extra.integers(2 ** 63)))
+    return graph
@@ -0,0 +1,140 @@
+from array import array
+
+import numpy as np
+
+from model.algorithms import solve_maze_bfs
+from model.solvers import neighbor_function
+
+
+class TreeIndex:
+    """
+    Índice de consultas de camino para laberintos perfectos (árboles).
+
+    Se construye una vez por laberinto: un BFS desde la raíz da los arreglos
+    ``parent`` y ``depth``, y sobre ellos se arma la tabla de binary lifting
+    para el ancestro común más bajo (LCA). Con eso la longitud de un camino
+    se responde en O(log n) y el camino completo en O(longitud).
+    """
+
+    def __init__(self, graph, root=(0, 0)):
+        """
+        Construye el índice. Lanza ``ValueError`` si el grafo no es un árbol
+        de expansión de la cuadrícula (tiene ciclos o no es conexo).
+        """
+        width = graph.width
+        total = width * graph.height
+        neighbors = neighbor_function(graph)
+        typecode = "i" if total < 2 ** 31 else "q"
+        self.width = width
+
+        root_index = root[1] * width + root[0]
+        parent = array(typecode, [-1]) * total
+        depth = array(typecode, [-1]) * total
+        parent[root_index] = root_index
+        depth[root_index] = 0
+        queue = array(typecode, [root_index])
+
+        head = 0
+        while head < len(queue):
+            current = queue[head]
+            head += 1
+            next_depth = depth[current] + 1
+            for neighbor in neighbors(current):
+                if depth[neighbor] < 0:
+                    depth[neighbor] = next_depth
+                    parent[neighbor] = current
+                    queue.append(neighbor)
+                elif neighbor != parent[current]:
+                    raise ValueError("El laberinto tiene ciclos: no es un árbol.")
+
+        if len(queue) != total:
+            raise ValueError("El laberinto no es conexo: no es un árbol.")
+
+        self.parent = parent
+        self.depth = depth
+
+        # up[k][i] = ancestro 2^k de i (la raíz es su propio padre)
+        levels = max(1, (max(depth) + 1).bit_length())
+        dtype = np.int32 if typecode == "i" else np.int64
+        current_level = np.frombuffer(parent, dtype=dtype).copy()
+        self.up = [parent]
+        for _ in range(1, levels):
+            current_level = current_level[current_level]
+            self.up.append(array(typecode, current_level.tobytes()))
+
+    def _index(self, node):
+        return node[1] * self.width + node[0]
+
+    def lca(self, node1, node2):
+        """Ancestro común más bajo de dos celdas, como índice plano."""
+        a, b = self._index(node1), self._index(node2)
+        depth, up = self.depth, self.up
+        if depth[a] < depth[b]:
+            a, b = b, a
+        diff = depth[a] - depth[b]
+        level = 0
+        while diff:
+            if diff & 1:
+                a = up[level][a]
+            diff >>= 1
+            level += 1
+        if a == b:
+            return a
+        for level in range(len(up) - 1, -1, -1):
+            if up[level][a] != up[level][b]:
+                a = up[level][a]
+                b = up[level][b]
+        return self.parent[a]
+
+    def path_length(self, start, end):
+        """Cantidad de pasos del único camino entre dos celdas, en O(log n)."""
+        ancestor = self.lca(start, end)
+        depth = self.depth
+        return depth[self._index(start)] + depth[self._index(end)] - 2 * depth[ancestor]
+
+    def path(self, start, end):
+        """Camino entre dos celdas como lista de nodos, en O(longitud)."""
+        ancestor = self.lca(start, end)
+        width, parent = self.width, self.parent
+
+        up_side = []
+        current = self._index(start)
+        while current != ancestor:
+            up_side.append(current)
+            current = parent[current]
+        up_side.append(ancestor)
+
+        down_side = []
+        current = self._index(end)
+        while current != ancestor:
+            down_side.append(current)
+            current = parent[current]
+        down_side.reverse()
+
+        return [(index % width, index // width) for index in up_side + down_side]
+
+
+def build_tree_index(graph, root=(0, 0)):
+    """Retorna un ``TreeIndex`` si el laberinto es perfecto, o ``None`` si no."""
+    edges = getattr(graph, "edge_count", None)
+    if edges is not None and edges != graph.width * graph.height - 1:
+        # Un árbol de n celdas tiene exactamente n - 1 pasajes
+        return None
+    try:
+        return TreeIndex(graph, root)
+    except ValueError:
+        return None
+
+
+def solve_maze_indexed(graph, start, end, index=None, fallback=solve_maze_bfs):
+    """
+    Resuelve con el índice de árbol si está disponible.
+
+    Sin índice (laberintos con pasajes extra) delega en ``fallback``.
+    Mantiene el contrato ``(path, visited)``: con índice, los visitados
+    son solo las celdas del camino.
+    """
+    if index is None:
+        return fallback(graph, start, end)
+    path = index.path(start, end)
+    return path, set(path)
@@ -0,0 +1,219 @@
+import random
+from array import array
+
+import numpy as np
+
+from model.algorithms import assign_entry_exit
+from model.graph import EAST, NORTH, SOUTH, WEST, GridGraph
+from model.instrumentation import measure
+
+
+# Aristas convertidas a enteros de Python por iteración del bucle de Kruskal
+_CHUNK = 1 << 16
+
+
+class ArrayDisjointSet:
+    """
+    Conjuntos disjuntos sobre índices planos de celda.
+
+    ``parent`` es un arreglo plano de int32 y ``rank`` un byte por celda (el
+    rango nunca supera log2(n)). ``find`` es iterativo con división de caminos
+    (path halving), así que no hay recursión ni diccionarios con tuplas.
+    """
+
+    def __init__(self, size):
+        """Inicializa ``size`` celdas, cada una en su propio grupo."""
+        self.parent = array("i", range(size))
+        self.rank = bytearray(size)
+
+    def find(self, node):
+        """Find iterativo con path halving."""
+        parent = self.parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(self, node1, node2):
+        """Union por rango para árboles más balanceados."""
+        root1 = self.find(node1)
+        root2 = self.find(node2)
+        if root1 == root2:
+            return False
+        rank = self.rank
+        if rank[root1] < rank[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        if rank[root1] == rank[root2]:
+            rank[root1] += 1
+        return True
+
+
+def as_generator(rng=None):
+    """
+    Normaliza ``rng`` a un ``numpy.random.Generator``.
+
+    Acepta un ``Generator``, una semilla entera, ``None`` o un
+    ``random.Random`` (del que se toma una semilla de 64 bits), de modo que
+    estas funciones comparten la convención de semillas de ``model.algorithms``.
+    """
+    if isinstance(rng, np.random.Generator):
+        return rng
+    if isinstance(rng, random.Random):
+        return np.random.default_rng(rng.getrandbits(64))
+    return np.random.default_rng(rng)
+
+
+def grid_edges(width, height):
+    """
+    Retorna todas las aristas posibles de la cuadrícula como dos arreglos de
+    índices planos ``(a, b)``, con ``b`` a la derecha o debajo de ``a``.
+    """
+    total = width * height
+    dtype = np.int32 if total < 2 ** 31 else np.int64
+    cells = np.arange(total, dtype=dtype).reshape(height, width)
+    horizontal = cells[:, :-1].ravel()
+    vertical = cells[:-1, :].ravel()
+    a = np.concatenate((horizontal, vertical))
+    b = np.concatenate((horizontal + 1, vertical + width))
+    return a, b
+
+
+def kruskal_spanning_tree(width, height, rng=None, progress=None):
+    """
+    Árbol de expansión aleatorio por Kruskal sobre arreglos de enteros.
+
+    Las aristas se generan y permutan con NumPy; el union-find recorre
+    ``parent``/``rank`` planos. Retorna los extremos ``(a, b)`` de las
+    aristas elegidas. ``progress(celdas)`` se llama tras cada bloque de
+    aristas con las celdas ya unidas; si lanza una excepción se interrumpe.
+    """
+    rng = as_generator(rng)
+    total = width * height
+    a, b = grid_edges(width, height)
+    order = rng.permutation(a.size)
+    a = a[order]
+    b = b[order]
+
+    ds = ArrayDisjointSet(total)
+    parent, rank = ds.parent, ds.rank
+    chosen = np.zeros(a.size, dtype=bool)
+    remaining = total - 1
+
+    # find/union en línea: es el bucle caliente del algoritmo. Las aristas se
+    # convierten a enteros de Python por bloques para no duplicar la memoria.
+    for offset in range(0, a.size, _CHUNK):
+        if remaining == 0:
+            break
+        if progress is not None and offset:
+            progress(total - remaining)
+        block_a = a[offset:offset + _CHUNK].tolist()
+        block_b = b[offset:offset + _CHUNK].tolist()
+        for i, u in enumerate(block_a, offset):
+            v = block_b[i - offset]
+            while parent[u] != u:
+                parent[u] = parent[parent[u]]
+                u = parent[u]
+            while parent[v] != v:
+                parent[v] = parent[parent[v]]
+                v = parent[v]
+            if u == v:
+                continue
+            if rank[u] < rank[v]:
+                u, v = v, u
+            parent[v] = u
+            if rank[u] == rank[v]:
+                rank[u] += 1
+            chosen[i] = True
+            remaining -= 1
+            if remaining == 0:
+                break
+
+    return a[chosen], b[chosen]
+
+
+def open_passages(graph, a, b):
+    """
+    Derriba en bloque las paredes entre las celdas ``a[i]`` y ``b[i]``.
+
+    ``b`` debe ser el vecino derecho o inferior de ``a`` y cada par debe
+    aparecer una sola vez, con la pared aún levantada (así ``edge_count``
+    suma ``a.size``). Sobre ``GridGraph`` escribe la máscara de pasajes
+    con operaciones vectorizadas; sobre otros grafos usa ``add_edge``.
+    """
+    if not isinstance(graph, GridGraph):
+        width = graph.width
+        for u, v in zip(a.tolist(), b.tolist()):
+            graph.add_edge((u % width, u // width), (v % width, v // width))
+        return
+
+    passages = np.frombuffer(graph.passages, dtype=np.uint8)
+    # con una sola columna las aristas verticales también cumplen b == a + 1
+    horizontal = (b == a + 1) if graph.width > 1 else np.zeros(a.size, dtype=bool)
+    east, west = a[horizontal], b[horizontal]
+    south, north = a[~horizontal], b[~horizontal]
+    passages[east] |= EAST
+    passages[west] |= WEST
+    passages[south] |= SOUTH
+    passages[north] |= NORTH
+    graph.edge_count += int(a.size)
+
+
+def generate_maze_kruskal_vectorized(graph, ratio=0.3, rng=None, progress=None,
+                                     instrumentation=None):
+    """
+    Genera un laberinto con el Kruskal vectorizado sobre el grafo.
+
+    Misma firma que ``generate_maze_kruskal``: ``progress`` recibe las celdas
+    ya unidas al árbol e ``instrumentation`` registra las fases de tallado y
+    pasajes extra.
+    """
+    rng = as_generator(rng)
+    with measure(instrumentation, "carve", algorithm="Kruskal",
+                 width=graph.width, height=graph.height) as record:
+        a, b = kruskal_spanning_tree(graph.width, graph.height, rng, progress)
+        open_passages(graph, a, b)
+        record["cells_carved"] = int(a.size) + 1
+
+    with measure(instrumentation, "extra_passages", ratio=ratio) as record:
+        record["passages_added"] = add_extra_passages_batched(graph, ratio, rng=rng)
+    assign_entry_exit(graph, rng=int(rng.integers(2 ** 63)))
+
+
+def add_extra_passages_batched(graph, ratio, rng=None):
+    """
+    Versión por lotes de ``add_extra_passages``.
+
+    Sortea todos los pasajes candidatos de una vez, descarta duplicados y
+    paredes ya derribadas, y abre el resto en bloque. Retorna cuántos pasajes
+    nuevos se abrieron realmente (puede ser menor que ``ratio * celdas``).
+    """
+    rng = as_generator(rng)
+    width, height = graph.width, graph.height
+    count = int(width * height * ratio)
+    if count <= 0 or width < 2 or height < 2:
+        return 0
+
+    x = rng.integers(0, width - 1, size=count)
+    y = rng.integers(0, height - 1, size=count)
+    vertical = rng.integers(0, 2, size=count)
+
+    # Clave única por pared: celda * 2 + (0 = derecha, 1 = abajo)
+    keys = np.unique((y * width + x) * 2 + vertical)
+    a = keys >> 1
+    vertical = (keys & 1).astype(bool)
+    b = np.where(vertical, a + width, a + 1)
+
+    if isinstance(graph, GridGraph):
+        passages = np.frombuffer(graph.passages, dtype=np.uint8)
+        bits = np.where(vertical, SOUTH, EAST)
+        closed = (passages[a] & bits) == 0
+    else:
+        closed = np.array([
+            (v % width, v // width) not in graph.neighbors((u % width, u // width))
+            for u, v in zip(a.tolist(), b.tolist())
+        ], dtype=bool)
+
+    a, b = a[closed], b[closed]
+    open_passages(graph, a, b)
+    return int(a.size)
@@ -0,0 +1,150 @@
+import heapq
+from array import array
+
+from model.algorithms import PROGRESS_INTERVAL, drain
+from model.rng import make_rng
+from model.solvers import _chain, _to_nodes, neighbor_function
+
+
+def generate_terrain(graph, max_cost=9, patch=4, rng=None):
+    """
+    Asigna a ``graph.costs`` un costo por celda entre 1 y ``max_cost``.
+
+    El costo es el de entrar a la celda. Se sortea por parches de
+    ``patch`` x ``patch`` celdas para que se formen zonas de terreno. Retorna
+    el ``bytearray`` de costos (índice plano ``y * width + x``).
+    """
+    if not 1 <= max_cost <= 255:
+        raise ValueError("max_cost debe estar entre 1 y 255.")
+    rng = make_rng(rng)
+    width, height = graph.width, graph.height
+    columns = -(-width // patch)
+
+    costs = bytearray()
+    for top in range(0, height, patch):
+        blocks = [rng.randint(1, max_cost) for _ in range(columns)]
+        row = bytes(cost for cost in blocks for _ in range(patch))[:width]
+        costs += row * min(patch, height - top)
+
+    graph.costs = costs
+    return costs
+
+
+def _weighted_search(graph, start, end, use_heuristic, batch_size=None, progress=None,
+                     stats=None):
+    """
+    Núcleo compartido de Dijkstra y A* sobre índices planos.
+
+    Usa ``graph.costs`` (costo de entrar a cada celda) o costo 1 si el grafo
+    no tiene terreno. Distancias y padres viven en arreglos preasignados y el
+    heap guarda enteros ``prioridad * total + índice``: no hay diccionarios
+    por nodo ni tuplas como claves. La heurística de A* es la distancia
+    Manhattan por el costo mínimo, que nunca sobreestima. Mismo protocolo de
+    generador que ``model.algorithms._bfs_search``.
+    """
+    width = graph.width
+    total = width * graph.height
+    neighbors = neighbor_function(graph)
+    costs = getattr(graph, "costs", None)
+    source = start[1] * width + start[0]
+    target = end[1] * width + end[0]
+    tx, ty = end
+
+    min_cost = min(costs) if costs else 1
+    infinity = 2 ** 62
+    dist = array("q", [infinity]) * total
+    parent = array("i" if total < 2 ** 31 else "q", [-1]) * total
+    closed = bytearray(total)
+    heappush, heappop = heapq.heappush, heapq.heappop
+
+    dist[source] = 0
+    heap = [source]
+    pushes = 1
+    pops = 0
+    expanded = []
+    batch = [] if batch_size else None
+
+    while heap:
+        current = heappop(heap) % total
+        pops += 1
+        if closed[current]:
+            continue
+        closed[current] = 1
+        expanded.append(current)
+        if batch is not None:
+            batch.append((current % width, current // width))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if current == target:
+            break
+        if progress is not None and not len(expanded) % PROGRESS_INTERVAL:
+            progress(len(expanded))
+
+        base = dist[current]
+        for neighbor in neighbors(current):
+            if closed[neighbor]:
+                continue
+            distance = base + (costs[neighbor] if costs is not None else 1)
+            if distance < dist[neighbor]:
+                dist[neighbor] = distance
+                parent[neighbor] = current
+                if use_heuristic:
+                    y, x = divmod(neighbor, width)
+                    distance += min_cost * (abs(x - tx) + abs(y - ty))
+                heappush(heap, distance * total + neighbor)
+                pushes += 1
+
+    if batch:
+        yield batch
+    if stats is not None:
+        stats["nodes_expanded"] = len(expanded)
+        stats["heap_pushes"] = pushes
+        stats["heap_pops"] = pops
+        if closed[target]:
+            stats["path_cost"] = dist[target]
+
+    visited = set(_to_nodes(expanded, width))
+    if not closed[target]:
+        return [], visited
+    path = _chain(parent, target)
+    path.reverse()
+    return _to_nodes(path, width), visited
+
+
+def path_cost(graph, path):
+    """Costo total de un camino: la suma de los costos de las celdas a las que entra."""
+    costs = getattr(graph, "costs", None)
+    if costs is None:
+        return max(0, len(path) - 1)
+    width = graph.width
+    return sum(costs[y * width + x] for x, y in path[1:])
+
+
+def solve_maze_dijkstra(graph, start, end, progress=None, stats=None):
+    """
+    Camino de costo mínimo con Dijkstra (ver ``_weighted_search``).
+
+    Retorna ``(path, visited)`` como ``solve_maze_bfs``; sin terreno, el
+    camino tiene la misma longitud que el de BFS.
+    """
+    return drain(_weighted_search(graph, start, end, False, progress=progress, stats=stats))
+
+
+def solve_maze_weighted_astar(graph, start, end, progress=None, stats=None):
+    """Camino de costo mínimo con A* ponderado (ver ``_weighted_search``)."""
+    return drain(_weighted_search(graph, start, end, True, progress=progress, stats=stats))
+
+
+def iter_solve_dijkstra(graph, start, end, batch_size=256, stats=None):
+    """Variante incremental de ``solve_maze_dijkstra`` (ver ``iter_solve_bfs``)."""
+    if batch_size < 1:
+        raise ValueError("batch_size debe ser al menos 1.")
+    return _weighted_search(graph, start, end, False, batch_size, stats=stats)
+
+
+def iter_solve_weighted_astar(graph, start, end, batch_size=256, stats=None):
+    """Variante incremental de ``solve_maze_weighted_astar`` (ver ``iter_solve_bfs``)."""
+    if batch_size < 1:
+        raise ValueError("batch_size debe ser al menos 1.")
+    return _weighted_search(graph, start, end, True, batch_size, stats=stats)
@@ -0,0 +1,245 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+from batch import ALGORITHMS, _dimension
+from controller.headless import build_maze
+from model.algorithms import solve_maze_bfs
+from model.analytics import analyze_maze
+from model.rng import spawn_seeds
+
+# Métricas que se pueden restringir: las de analyze_maze más los nodos
+# explorados por solve_maze_bfs (que solo se calculan si hacen falta).
+METRICS = (
+    "cells", "passages", "dead_ends", "corridors", "junctions", "dead_end_ratio",
+    "reachable", "solution_length", "solution_share", "diameter", "explored",
+)
+# Candidatos en vuelo por proceso: los suficientes para no dejarlos ociosos
+# y pocos como para cortar enseguida al llegar a la cantidad pedida.
+IN_FLIGHT = 2
+
+
+def check_constraints(constraints):
+    """
+    Valida un diccionario ``{"min_<métrica>": valor, "max_<métrica>": valor}``.
+
+    Lanza ``ValueError`` si una clave no es de esa forma o la métrica no existe.
+    """
+    for key in constraints:
+        bound, _, metric = key.partition("_")
+        if bound not in ("min", "max") or metric not in METRICS:
+            raise ValueError(f"Restricción desconocida: {key}")
+
+
+def meets(metrics, constraints):
+    """Indica si las métricas cumplen todas las cotas (ver ``check_constraints``)."""
+    for key, limit in constraints.items():
+        bound, _, metric = key.partition("_")
+        value = metrics.get(metric)
+        if value is None:
+            return False
+        if value < limit if bound == "min" else value > limit:
+            return False
+    return True
+
+
+def evaluate_candidate(job):
+    """
+    Genera y mide un candidato dentro de un proceso del pool.
+
+    Recibe y retorna diccionarios serializables, como ``batch.run_job``.
+    """
+    started = time.perf_counter()
+    graph = build_maze(job["width"], job["height"], job["algorithm"], job["seed"],
+                       ratio=job["ratio"])
+    metrics = analyze_maze(graph)
+    if job["explored"]:
+        _, visited = solve_maze_bfs(graph, graph.entry, graph.exit)
+        metrics["explored"] = len(visited)
+    return {
+        "index": job["index"],
+        "seed": job["seed"],
+        "metrics": metrics,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def find_mazes(width, height, constraints, count=1, algorithm="dfs", ratio=0.3, seed=0,
+               max_candidates=10_000, workers=None, on_result=None):
+    """
+    Busca en paralelo laberintos que cumplan ``constraints``.
+
+    Los candidatos usan semillas derivadas de ``seed`` (el candidato ``i``
+    siempre es el mismo laberinto) y se evalúan en un pool de procesos. Cada
+    resultado se puntúa apenas llega; al juntar ``count`` candidatos válidos
+    se cancelan los pendientes y no se lanza ninguno más. Solo hay
+    ``IN_FLIGHT`` candidatos por proceso en vuelo, así que el corte es
+    inmediato. ``on_result`` recibe cada resultado y si cumple.
+
+    Retorna ``(encontrados, evaluados)``: hasta ``count`` resultados
+    ``{"index", "seed", "metrics", "seconds"}`` ordenados por índice, y la
+    cantidad de candidatos evaluados. Con varios procesos, cuáles se
+    encuentran primero puede variar entre corridas.
+    """
+    check_constraints(constraints)
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Algoritmo '{algorithm}' no soportado.")
+    workers = workers or os.cpu_count() or 1
+    explored = any(key.endswith("_explored") for key in constraints)
+    jobs = (
+        {
+            "index": index,
+            "seed": child,
+            "width": width,
+            "height": height,
+            "algorithm": algorithm,
+            "ratio": ratio,
+            "explored": explored,
+        }
+        for index, child in enumerate(spawn_seeds(seed, max_candidates))
+    )
+
+    found = []
+    evaluated = 0
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = {executor.submit(evaluate_candidate, job)
+                   for job in islice(jobs, workers * IN_FLIGHT)}
+        while pending and len(found) < count:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                evaluated += 1
+                qualifies = meets(result["metrics"], constraints)
+                if qualifies:
+                    found.append(result)
+                if on_result is not None:
+                    on_result(result, qualifies)
+                job = next(jobs, None)
+                if job is not None and len(found) < count:
+                    pending.add(executor.submit(evaluate_candidate, job))
+    finally:
+        # Los procesos terminan el candidato que tengan en curso y salen
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    found.sort(key=lambda result: result["index"])
+    return found[:count], evaluated
+
+
+def parse_args(argv=None):
+    """Define los argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        description="Busca en paralelo laberintos que cumplan métricas objetivo."
+    )
+    parser.add_argument("--width", type=_dimension, default=25, help="ancho en celdas (mínimo 2)")
+    parser.add_argument("--height", type=_dimension, default=25, help="alto en celdas (mínimo 2)")
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default="dfs")
+    parser.add_argument("--ratio", type=float, default=0.3, help="proporción de pasajes extra")
+    parser.add_argument("--count", type=int, default=1,
+                        help="cantidad de laberintos válidos a encontrar")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="semilla base de la que se derivan los candidatos")
+    parser.add_argument("--max-candidates", type=int, default=10_000,
+                        help="candidatos a probar como máximo")
+    parser.add_argument("--min-solution", type=int, default=None,
+                        help="largo mínimo de la solución (pasos)")
+    parser.add_argument("--max-solution", type=int, default=None,
+                        help="largo máximo de la solución (pasos)")
+    parser.add_argument("--dead-end-ratio", type=float, nargs=2, default=None,
+                        metavar=("MIN", "MAX"), help="rango de callejones por celda")
+    parser.add_argument("--min-explored", type=int, default=None,
+                        help="nodos explorados mínimos por solve_maze_bfs")
+    parser.add_argument("--max-explored", type=int, default=None,
+                        help="nodos explorados máximos por solve_maze_bfs")
+    parser.add_argument("--require", action="append", default=[], metavar="COTA=VALOR",
+                        help="otra cota sobre las métricas, p. ej. min_diameter=300")
+    parser.add_argument("--output", default=None,
+                        help="archivo JSON de resultados (por defecto, salida estándar)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="procesos del pool (por defecto, todos los núcleos)")
+    return parser.parse_args(argv)
+
+
+def build_constraints(args):
+    """
+    Arma el diccionario de restricciones a partir de los argumentos.
+
+    Lanza ``ValueError`` si un ``--require`` no tiene la forma ``COTA=VALOR``
+    con un valor numérico.
+    """
+    constraints = {}
+    if args.min_solution is not None:
+        constraints["min_solution_length"] = args.min_solution
+    if args.max_solution is not None:
+        constraints["max_solution_length"] = args.max_solution
+    if args.dead_end_ratio is not None:
+        constraints["min_dead_end_ratio"], constraints["max_dead_end_ratio"] = args.dead_end_ratio
+    if args.min_explored is not None:
+        constraints["min_explored"] = args.min_explored
+    if args.max_explored is not None:
+        constraints["max_explored"] = args.max_explored
+    for requirement in args.require:
+        key, separator, value = requirement.partition("=")
+        try:
+            if not separator or not key.strip():
+                raise ValueError
+            constraints[key.strip()] = float(value)
+        except ValueError:
+            raise ValueError(f"uso: --require COTA=VALOR con un valor numérico, "
+                             f"p. ej. min_diameter=300 (recibido: {requirement!r})") from None
+    return constraints
+
+
+def main(argv=None):
+    """Ejecuta la búsqueda. Retorna 1 si no se encontraron suficientes laberintos."""
+    args = parse_args(argv)
+    try:
+        constraints = build_constraints(args)
+        check_constraints(constraints)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+    started = time.perf_counter()
+
+    def report(result, qualifies):
+        if qualifies:
+            print(f"candidato {result['index']} (semilla {result['seed']}) cumple",
+                  file=sys.stderr)
+
+    try:
+        found, evaluated = find_mazes(
+            args.width, args.height, constraints, count=args.count,
+            algorithm=args.algorithm, ratio=args.ratio, seed=args.seed,
+            max_candidates=args.max_candidates, workers=args.workers, on_result=report,
+        )
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+    elapsed = time.perf_counter() - started
+    print(f"{len(found)} de {args.count} laberintos en {evaluated} candidatos "
+          f"({elapsed:.2f}s, {evaluated / max(elapsed, 1e-9):.1f} candidatos/s)", file=sys.stderr)
+
+    text = json.dumps({
+        "width": args.width,
+        "height": args.height,
+        "algorithm": args.algorithm,
+        "ratio": args.ratio,
+        "constraints": constraints,
+        "evaluated": evaluated,
+        "mazes": found,
+    }, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    else:
+        print(text)
+    return 0 if len(found) >= args.count else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
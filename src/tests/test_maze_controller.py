@@ -0,0 +1,79 @@
+import time
+
+from controller.headless import MazeSession, build_maze
+from controller.maze_controller import MazeController
+from controller.workers import WorkerPool
+from model.graph import GridGraph
+
+
+class FakeWidget:
+    """Widget sin Tk: ``after`` no programa nada (los trabajos corren igual)."""
+
+    def after(self, ms, callback):
+        return None
+
+
+class FakeView:
+    mode = "maze"
+
+    def solution_is_static(self, graph):
+        return True
+
+    def __getattr__(self, name):
+        # update_info, draw_wall_edit, draw_maze... no hacen nada
+        return lambda *args, **kwargs: None
+
+
+class WatchedGraph(GridGraph):
+    """Cuenta las lecturas de vecinos que ocurren después de editar una pared."""
+
+    editing = False
+    reads_after_edit = 0
+
+    def neighbors(self, node):
+        if self.editing:
+            self.reads_after_edit += 1
+        return super().neighbors(node)
+
+    def add_edge(self, node1, node2):
+        self.editing = True
+        super().add_edge(node1, node2)
+
+    def remove_edge(self, node1, node2):
+        self.editing = True
+        super().remove_edge(node1, node2)
+
+
+def _controller(graph):
+    controller = MazeController.__new__(MazeController)
+    controller.session = MazeSession()
+    controller.session.set_graph(graph, seed=1, algorithm="DFS")
+    controller.workers = WorkerPool(FakeWidget())
+    controller._solve_task = None
+    controller._repair_task = None
+    controller._shown = None
+    controller.view = FakeView()
+    return controller
+
+
+def test_toggle_wall_waits_for_a_running_solve():
+    source = build_maze(400, 400, "DFS", 1)
+    graph = WatchedGraph(400, 400)
+    graph.passages[:] = source.passages
+    graph.edge_count = source.edge_count
+    graph.entry, graph.exit = source.entry, source.exit
+    controller = _controller(graph)
+
+    controller.solve_maze("BFS")
+    task = controller._solve_task
+    deadline = time.monotonic() + 10
+    while task.progress is None and not task.future.done():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+    assert not task.future.done(), "la búsqueda terminó antes de editar"
+
+    controller.toggle_wall((0, 0), (1, 0))
+    assert task.future.done()
+    time.sleep(0.05)
+    assert graph.reads_after_edit == 0
+    controller.workers.shutdown()
@@ -0,0 +1,23 @@
+import random
+
+import numpy as np
+import pytest
+
+from model.rng import spawn_seeds
+
+
+def test_integer_seed_is_reproducible():
+    assert spawn_seeds(42, 3) == spawn_seeds(42, 3)
+
+
+def test_none_seed_changes_between_calls():
+    assert spawn_seeds(None, 2) != spawn_seeds(None, 2)
+
+
+def test_random_instance_is_reproducible():
+    assert spawn_seeds(random.Random(5), 3) == spawn_seeds(random.Random(5), 3)
+
+
+def test_unsupported_seed_type_raises():
+    with pytest.raises(TypeError):
+        spawn_seeds(np.random.default_rng(5), 2)
@@ -0,0 +1,31 @@
+import random
+
+import numpy as np
+import pytest
+
+from model.graph import GridGraph
+from model.tiled import generate_maze_tiled
+
+
+def _tiled(rng, workers):
+    graph = GridGraph(37, 29)
+    generate_maze_tiled(graph, tile=8, rng=rng, workers=workers)
+    return bytes(graph.passages), graph.entry, graph.exit
+
+
+@pytest.mark.parametrize("workers", [1, 2, 4])
+def test_random_instance_is_deterministic_across_workers(workers):
+    """Un ``random.Random`` con la misma semilla da el mismo laberinto."""
+    assert _tiled(random.Random(7), workers) == _tiled(random.Random(7), 1)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_numpy_generator_is_deterministic_across_workers(workers):
+    expected = _tiled(np.random.default_rng(7), 1)
+    assert _tiled(np.random.default_rng(7), workers) == expected
+
+
+def test_perfect_maze_without_extra_passages():
+    graph = GridGraph(40, 25)
+    generate_maze_tiled(graph, tile=7, ratio=0, rng=3, workers=1)
+    assert graph.edge_count == 40 * 25 - 1
@@ -0,0 +1,83 @@
+import math
+import time
+
+# Duración aproximada de un cuadro a 60 Hz, en milisegundos
+FRAME_MS = 16
+
+
+class FrameAnimator:
+    """
+    Reproduce animaciones de canvas con un presupuesto de tiempo por cuadro.
+
+    En lugar de programar un ``after`` por paso, cada cuadro dibuja tantos
+    pasos como entren en ``budget_ms`` (y como pida el ritmo para terminar
+    en la duración objetivo), y luego cede el control al bucle de Tk. Así
+    una animación de miles de pasos dura lo pedido sin congelar la ventana.
+    """
+
+    def __init__(self, widget, budget_ms=FRAME_MS):
+        """``widget`` es cualquier widget de Tk, usado para ``after``."""
+        self.widget = widget
+        self.budget = budget_ms / 1000
+        self._after = None
+        self._draw = None
+        self._on_done = None
+
+    @property
+    def running(self):
+        """Indica si hay una animación en curso."""
+        return self._draw is not None
+
+    def play(self, count, draw, duration_ms=0, on_done=None):
+        """
+        Anima ``count`` pasos llamando a ``draw(i)`` para ``i = 0..count-1``.
+
+        Con ``duration_ms`` mayor que cero los pasos se reparten para que la
+        animación dure aproximadamente ese tiempo; con 0 se dibuja lo más
+        rápido posible respetando el presupuesto por cuadro. ``on_done`` se
+        llama al terminar (no si se cancela). Cancela la animación anterior.
+        """
+        self.cancel()
+        self._draw = draw
+        self._on_done = on_done
+        self._count = count
+        self._drawn = 0
+        self._duration = duration_ms / 1000
+        self._start = time.perf_counter()
+        self._tick()
+
+    def cancel(self):
+        """Detiene la animación en curso, si la hay."""
+        if self._after is not None:
+            self.widget.after_cancel(self._after)
+            self._after = None
+        self._draw = None
+        self._on_done = None
+
+    def _tick(self):
+        self._after = None
+        tick_start = time.perf_counter()
+        if self._duration > 0:
+            progress = (tick_start - self._start) / self._duration
+            target = min(self._count, math.ceil(self._count * progress))
+        else:
+            target = self._count
+
+        draw, drawn, deadline = self._draw, self._drawn, tick_start + self.budget
+        while drawn < target:
+            draw(drawn)
+            drawn += 1
+            if time.perf_counter() >= deadline:
+                break
+        self._drawn = drawn
+
+        if drawn >= self._count:
+            on_done = self._on_done
+            self._draw = None
+            self._on_done = None
+            if on_done is not None:
+                on_done()
+            return
+
+        spent_ms = int((time.perf_counter() - tick_start) * 1000)
+        self._after = self.widget.after(max(1, FRAME_MS - spent_ms), self._tick)
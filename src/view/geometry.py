@@ -0,0 +1,100 @@
+from model.graph import EAST, SOUTH
+
+
+def _passage_checks(graph):
+    """
+    Retorna dos funciones ``(x, y) -> bool`` que indican si hay pasaje hacia
+    el este y hacia el sur, leyendo los bits de ``GridGraph`` cuando existen.
+    """
+    passages = getattr(graph, "passages", None)
+    if passages is not None:
+        width = graph.width
+
+        def east_open(x, y):
+            return passages[y * width + x] & EAST
+
+        def south_open(x, y):
+            return passages[y * width + x] & SOUTH
+    else:
+        def east_open(x, y):
+            return (x + 1, y) in graph.neighbors((x, y))
+
+        def south_open(x, y):
+            return (x, y + 1) in graph.neighbors((x, y))
+
+    return east_open, south_open
+
+
+def wall_runs(graph, x0=0, y0=0, x1=None, y1=None):
+    """
+    Calcula las paredes del laberinto fusionadas en tramos rectos.
+
+    Cada pared compartida aparece una sola vez y las paredes colineales
+    contiguas se unen en un único tramo. Se puede limitar a la región de
+    celdas ``[x0, x1) x [y0, y1)``. Retorna dos listas en coordenadas de
+    celda:
+
+    - horizontales: ``(y, x_inicio, x_fin)``, línea superior de la fila ``y``
+    - verticales: ``(x, y_inicio, y_fin)``, línea izquierda de la columna ``x``
+    """
+    width, height = graph.width, graph.height
+    x1 = width if x1 is None else min(x1, width)
+    y1 = height if y1 is None else min(y1, height)
+    east_open, south_open = _passage_checks(graph)
+
+    horizontal = []
+    for y in range(y0, y1 + 1 if y1 == height else y1):
+        border = y == 0 or y == height
+        start = None
+        for x in range(x0, x1):
+            wall = border or not south_open(x, y - 1)
+            if wall and start is None:
+                start = x
+            elif not wall and start is not None:
+                horizontal.append((y, start, x))
+                start = None
+        if start is not None:
+            horizontal.append((y, start, x1))
+
+    vertical = []
+    for x in range(x0, x1 + 1 if x1 == width else x1):
+        border = x == 0 or x == width
+        start = None
+        for y in range(y0, y1):
+            wall = border or not east_open(x - 1, y)
+            if wall and start is None:
+                start = y
+            elif not wall and start is not None:
+                vertical.append((x, start, y))
+                start = None
+        if start is not None:
+            vertical.append((x, start, y1))
+
+    return horizontal, vertical
+
+
+def cost_runs(graph, x0=0, y0=0, x1=None, y1=None):
+    """
+    Agrupa las celdas de igual costo de ``graph.costs`` en tramos por fila.
+
+    Retorna una lista ``(y, x_inicio, x_fin, costo)`` dentro de la región
+    ``[x0, x1) x [y0, y1)``, omitiendo las celdas de costo 1 (terreno llano).
+    Sin terreno retorna una lista vacía.
+    """
+    costs = getattr(graph, "costs", None)
+    if costs is None:
+        return []
+    width = graph.width
+    x1 = width if x1 is None else min(x1, width)
+    y1 = graph.height if y1 is None else min(y1, graph.height)
+
+    runs = []
+    for y in range(y0, y1):
+        row = costs[y * width + x0:y * width + x1]
+        start = 0
+        for x in range(1, len(row) + 1):
+            if x == len(row) or row[x] != row[start]:
+                if row[start] > 1:
+                    runs.append((y, x0 + start, x0 + x, row[start]))
+                start = x
+    return runs
@@ -1,5 +1,13 @@
+from math import floor
+from tkinter import filedialog
+
 import customtkinter as ctk
 
+from view.animation import FrameAnimator
+from view.geometry import cost_runs, wall_runs
+from view.raster import render_maze, terrain_shade, to_photo_image
+from view.viewport import TiledViewport
+
 
 class MazeView:
     """
@@ -13,7 +21,8 @@ class MazeView:
         """
         self.root = root
         self.controller = controller
-        self.cell_size = 25
+        self.default_cell_size = 25
+        self.cell_size = self.default_cell_size
         self.margin = 15
         self.difficulties = {
             "Fácil": {"size": (25, 25), "passages": 0.5},
@@ -21,11 +30,15 @@ class MazeView:
             "Difícil": {"size": (45, 30), "passages": 0.15}
         }
         self.current_difficulty = "Fácil"
+        # A partir de esta cantidad de celdas se dibuja un único bitmap
+        self.raster_threshold = 250_000
+        self._photo = None
 
         # Calcular tamaño inicial de canvas
         initial_size = self.difficulties["Fácil"]["size"]
         self.canvas_size = max(initial_size) * self.cell_size + self.margin * 2
         self.mode = "maze"
+        self.terrain_enabled = False
 
         self.info_label = ctk.CTkLabel(
             root,
@@ -34,14 +47,38 @@ class MazeView:
         )
         self.info_label.pack(pady=5)
 
+        canvas_frame = ctk.CTkFrame(root, fg_color="transparent")
+        canvas_frame.pack(pady=(0, 10))
+
         self.canvas = ctk.CTkCanvas(
-            root,
+            canvas_frame,
             width=self.canvas_size,
             height=self.canvas_size,
             bg="#1e1e1e",
             highlightthickness=0
         )
-        self.canvas.pack(pady=(0, 10))
+        self.canvas.grid(row=0, column=0)
+
+        # Barras de desplazamiento: solo visibles si el laberinto no entra en pantalla
+        self.scroll_y = ctk.CTkScrollbar(canvas_frame, command=self._scroll_y)
+        self.scroll_x = ctk.CTkScrollbar(canvas_frame, orientation="horizontal",
+                                         command=self._scroll_x)
+        self.canvas.configure(xscrollcommand=self.scroll_x.set,
+                              yscrollcommand=self.scroll_y.set)
+        self.viewport = TiledViewport(self)
+        # Clic derecho: derribar o levantar la pared más cercana al puntero
+        self.canvas.bind("<Button-3>", self._on_right_click)
+        self._raster_overlay = (None, None, "#057032")
+
+        # Duración objetivo de la animación de la solución (0 = instantánea)
+        self.animation_durations = {
+            "Animación: 1 s": 1000,
+            "Animación: 3 s": 3000,
+            "Animación: 10 s": 10000,
+            "Sin animación": 0,
+        }
+        self.animation_duration_ms = 3000
+        self.animator = FrameAnimator(root)
 
         self.setup_controls()
 
@@ -106,6 +143,71 @@ class MazeView:
         )
         btn_maze.grid(row=2, column=2, padx=8, pady=5)
 
+        # --- FILA 3 ---
+        btn_save = ctk.CTkButton(
+            frame, text="Guardar laberinto",
+            command=self.save_maze,
+            **button_style
+        )
+        btn_save.grid(row=3, column=0, padx=8, pady=5)
+
+        btn_open = ctk.CTkButton(
+            frame, text="Abrir laberinto",
+            command=self.open_maze,
+            **button_style
+        )
+        btn_open.grid(row=3, column=1, padx=8, pady=5)
+
+        animation_selector = ctk.CTkOptionMenu(
+            frame,
+            values=list(self.animation_durations),
+            command=self.change_animation_duration,
+            width=150
+        )
+        animation_selector.set("Animación: 3 s")
+        animation_selector.grid(row=3, column=2, padx=8, pady=5)
+
+        # --- FILA 4 ---
+        btn_metrics = ctk.CTkButton(
+            frame, text="Exportar métricas",
+            command=self.export_metrics,
+            **button_style
+        )
+        btn_metrics.grid(row=4, column=0, padx=8, pady=5)
+
+        btn_dijkstra = ctk.CTkButton(
+            frame, text="Resolver (Dijkstra)",
+            command=lambda: self.controller.solve_maze("DIJKSTRA"),
+            **button_style
+        )
+        btn_dijkstra.grid(row=4, column=1, padx=8, pady=5)
+
+        terrain_switch = ctk.CTkSwitch(
+            frame, text="Terreno con costos",
+            command=lambda: self.toggle_terrain(terrain_switch.get())
+        )
+        terrain_switch.grid(row=4, column=2, padx=8, pady=5)
+
+        # --- FILA 5 ---
+        btn_analyze = ctk.CTkButton(
+            frame, text="Analizar laberinto",
+            command=self.controller.analyze_maze,
+            **button_style
+        )
+        btn_analyze.grid(row=5, column=0, padx=8, pady=5)
+
+    def toggle_terrain(self, enabled):
+        """Activa o desactiva los costos por celda en los próximos laberintos."""
+        self.terrain_enabled = bool(enabled)
+
+    def change_animation_duration(self, value):
+        """Cambia la duración objetivo de la animación de la solución."""
+        self.animation_duration_ms = self.animation_durations[value]
+
+    def cancel_animation(self):
+        """Detiene la animación de la solución en curso, si la hay."""
+        self.animator.cancel()
+
     def change_difficulty(self, value):
         """Cambia la dificultad seleccionada."""
         self.current_difficulty = value
@@ -114,17 +216,66 @@ class MazeView:
 
         self.update_info(f"Dificultad: {value} ({width}x{height} celdas)")
 
+    def _scroll_x(self, *args):
+        self.canvas.xview(*args)
+        self.viewport.schedule_refresh()
+
+    def _scroll_y(self, *args):
+        self.canvas.yview(*args)
+        self.viewport.schedule_refresh()
+
+    def _max_canvas_size(self):
+        """Tamaño máximo del canvas para que la ventana entre en pantalla."""
+        screen_width = self.root.winfo_screenwidth()
+        screen_height = self.root.winfo_screenheight()
+        return int(screen_width * 0.9) - 50, int(screen_height * 0.9) - 215
+
+    def fit_cell_size(self, width, height):
+        """Elige un tamaño de celda para que el laberinto entero entre en el canvas."""
+        max_width, max_height = self._max_canvas_size()
+        fitting = min((max_width - self.margin * 2) // max(1, width),
+                      (max_height - self.margin * 2) // max(1, height))
+        self.cell_size = max(1, min(self.default_cell_size, fitting))
+
+    def update_scrollregion(self, graph):
+        """Ajusta la región desplazable al tamaño del laberinto; la retorna."""
+        total_width = graph.width * self.cell_size + self.margin * 2
+        total_height = graph.height * self.cell_size + self.margin * 2
+        self.canvas.configure(scrollregion=(0, 0, total_width, total_height),
+                              xscrollincrement=self.cell_size,
+                              yscrollincrement=self.cell_size)
+        return total_width, total_height
+
     def resize_canvas(self, width, height):
-        """Redimensiona el canvas según el tamaño del laberinto."""
-        canvas_width = width * self.cell_size + self.margin * 2
-        canvas_height = height * self.cell_size + self.margin * 2
+        """
+        Redimensiona el canvas según el tamaño del laberinto.
+
+        Si el laberinto no entra en pantalla, el canvas queda acotado y se
+        activa el visor con scroll, zoom y teselas perezosas.
+        """
+        maze_width = width * self.cell_size + self.margin * 2
+        maze_height = height * self.cell_size + self.margin * 2
+        max_width, max_height = self._max_canvas_size()
+        canvas_width = min(maze_width, max_width)
+        canvas_height = min(maze_height, max_height)
 
         # Redimensionar canvas
-        self.canvas.configure(width=canvas_width, height=canvas_height)
+        self.canvas.configure(width=canvas_width, height=canvas_height,
+                              scrollregion=(0, 0, maze_width, maze_height))
+        self.canvas.xview_moveto(0)
+        self.canvas.yview_moveto(0)
+
+        self.viewport.enabled = maze_width > canvas_width or maze_height > canvas_height
+        if self.viewport.enabled:
+            self.scroll_y.grid(row=0, column=1, sticky="ns")
+            self.scroll_x.grid(row=1, column=0, sticky="ew")
+        else:
+            self.scroll_y.grid_remove()
+            self.scroll_x.grid_remove()
 
         # Ajustar tamaño de ventana centrada
-        window_width = canvas_width + 30
-        window_height = canvas_height + 195
+        window_width = canvas_width + 30 + (20 if self.viewport.enabled else 0)
+        window_height = canvas_height + 195 + (20 if self.viewport.enabled else 0)
 
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
@@ -141,9 +292,34 @@ class MazeView:
         passages_ratio = config["passages"]
 
         # Ajustar canvas antes de generar
+        self.cell_size = self.default_cell_size
         self.resize_canvas(width, height)
 
-        self.controller.generate_maze(width, height, algorithm)
+        self.controller.generate_maze(width, height, algorithm, terrain=self.terrain_enabled)
+
+    def save_maze(self):
+        """Pide una ruta y guarda el laberinto actual."""
+        path = filedialog.asksaveasfilename(
+            defaultextension=".maze",
+            filetypes=[("Laberinto", "*.maze")]
+        )
+        if path:
+            self.controller.save_to_file(path)
+
+    def open_maze(self):
+        """Pide un archivo .maze y lo carga."""
+        path = filedialog.askopenfilename(filetypes=[("Laberinto", "*.maze")])
+        if path:
+            self.controller.load_from_file(path)
+
+    def export_metrics(self):
+        """Pide una ruta y exporta las mediciones registradas como JSON."""
+        path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json")]
+        )
+        if path:
+            self.controller.export_metrics(path)
 
     def update_info(self, text):
         """Actualiza el label de información."""
@@ -152,38 +328,117 @@ class MazeView:
     def draw_maze(self, graph):
         """
         Dibuja el laberinto en el canvas, construyendo paredes según las adyacencias del grafo.
+
+        Cada pared compartida se dibuja una sola vez y las paredes colineales
+        se fusionan en tramos, así que hay un ítem de canvas por tramo y no
+        uno por lado de celda. El terreno, si lo hay, se pinta debajo con un
+        rectángulo por tramo de celdas de igual costo.
         """
-        self.canvas.delete("all")
-        wall_color = "#cccccc"
+        self.cancel_animation()
+        if self.viewport.enabled:
+            self.canvas.delete("all")
+            self.viewport.attach(graph)
+            self.draw_markers(graph)
+            return
 
-        for x in range(graph.width):
-            for y in range(graph.height):
-                node = (x, y)
-                neighbors = graph.adjacency.get(node, [])
-                x1 = x * self.cell_size + self.margin
-                y1 = y * self.cell_size + self.margin
-                x2 = x1 + self.cell_size
-                y2 = y1 + self.cell_size
-
-                # Pared superior
-                if (x, y - 1) not in neighbors:
-                    self.canvas.create_line(x1, y1, x2, y1, width=2, fill=wall_color)
-                # Pared inferior
-                if (x, y + 1) not in neighbors:
-                    self.canvas.create_line(x1, y2, x2, y2, width=2, fill=wall_color)
-                # Pared derecha
-                if (x + 1, y) not in neighbors:
-                    self.canvas.create_line(x2, y1, x2, y2, width=2, fill=wall_color)
-                # Pared izquierda
-                if (x - 1, y) not in neighbors:
-                    self.canvas.create_line(x1, y1, x1, y2, width=2, fill=wall_color)
+        if self.uses_raster(graph):
+            self.draw_maze_raster(graph)
+            return
 
+        self.canvas.delete("all")
+        wall_color = "#cccccc"
+        size = self.cell_size
+        margin = self.margin
+
+        for y, x_start, x_end, cost in cost_runs(graph):
+            self.canvas.create_rectangle(x_start * size + margin, y * size + margin,
+                                         x_end * size + margin, (y + 1) * size + margin,
+                                         fill=terrain_shade(cost), outline="", tags="terrain")
+
+        horizontal, vertical = wall_runs(graph)
+        for y, x_start, x_end in horizontal:
+            py = y * size + margin
+            self.canvas.create_line(x_start * size + margin, py, x_end * size + margin, py,
+                                    width=2, fill=wall_color, tags="wall")
+        for x, y_start, y_end in vertical:
+            px = x * size + margin
+            self.canvas.create_line(px, y_start * size + margin, px, y_end * size + margin,
+                                    width=2, fill=wall_color, tags="wall")
+
+        self.draw_markers(graph)
+
+    def draw_markers(self, graph):
+        """Dibuja la abertura de salida y las marcas de entrada/salida."""
+        self.canvas.delete("marker")
         if graph.exit:
             self._draw_opening(graph.exit, graph.width, graph.height)
 
         # Dibujar flechas de entrada/salida
         self._draw_entry_exit_arrows(graph)
 
+    def uses_raster(self, graph):
+        """Indica si el laberinto es demasiado grande para ítems de canvas."""
+        return graph.width * graph.height > self.raster_threshold
+
+    def solution_is_static(self, graph):
+        """
+        Indica si la solución se dibuja de una vez (visor por teselas o raster)
+        en lugar de animarse sobre un laberinto redibujado.
+        """
+        return self.viewport.enabled or self.uses_raster(graph)
+
+    def draw_maze_raster(self, graph, path=None, visited=None, color="#057032"):
+        """
+        Dibuja el laberinto (y opcionalmente la búsqueda) como una sola imagen.
+
+        Paredes, visitados y camino se rasterizan en un búfer NumPy que se
+        muestra con un único ``PhotoImage``, así que el canvas tiene un solo
+        ítem sin importar el tamaño del laberinto.
+        """
+        self.canvas.delete("all")
+        self._raster_overlay = (path, visited, color)
+        image = render_maze(graph, max(1, self.cell_size), path=path,
+                            visited=visited, path_color=color)
+        self._photo = to_photo_image(image, master=self.canvas)
+        self.canvas.create_image(self.margin, self.margin, anchor="nw",
+                                 image=self._photo, tags="raster")
+
+    def show_solution(self, graph, path, visited, color="#057032", details=""):
+        """
+        Muestra la solución: animada en modo vectorial, de una vez en raster.
+
+        ``details`` (por ejemplo, las mediciones) se agrega al mensaje final.
+        """
+        if self.viewport.enabled:
+            self.viewport.set_overlay(path, visited, color)
+            self.update_info(self._solution_message(path, visited, details))
+        elif self.uses_raster(graph):
+            self.draw_maze_raster(graph, path=path, visited=visited, color=color)
+            self.update_info(self._solution_message(path, visited, details))
+        else:
+            self.draw_path_animated(path, visited=visited, color=color, details=details)
+
+    def _solution_message(self, path, visited, details=""):
+        text = (f"Camino encontrado: {len(path) - 1} pasos | "
+                f"Nodos explorados: {len(visited) - 1 if visited else '?'}")
+        return f"{text}\n{details}" if details else text
+
+    def canvas_mark(self):
+        """
+        Marca para contar los ítems que se crean a partir de ahora.
+
+        Tk numera los ítems con enteros crecientes que nunca se reutilizan: el
+        id de un ítem de prueba (creado y borrado enseguida) sirve de marca
+        aunque en el medio se borren otros ítems. Ver ``items_created_since``.
+        """
+        probe = self.canvas.create_line(0, 0, 0, 0)
+        self.canvas.delete(probe)
+        return probe
+
+    def items_created_since(self, mark):
+        """Cantidad de ítems creados en el canvas desde ``canvas_mark()``."""
+        return self.canvas_mark() - mark - 1
+
     def _draw_opening(self, node, width, height):
         """Rompe la pared del borde en la entrada o salida."""
         x, y = node
@@ -194,7 +449,7 @@ class MazeView:
 
         if x == width - 1:
             # Quitar parte de la pared derecha
-            self.canvas.create_line(x2, y1, x2, y2, fill="#1e1e1e", width=3)
+            self.canvas.create_line(x2, y1, x2, y2, fill="#1e1e1e", width=3, tags="marker")
 
     def _draw_entry_exit_arrows(self, graph):
         """Dibuja las flechas de entrada y salida en los bordes."""
@@ -211,7 +466,7 @@ class MazeView:
             self.canvas.create_oval(
                 x - radius, y - radius,
                 x + radius, y + radius,
-                fill="#54AFFF", outline="#0070D1", width=2, tags="player"
+                fill="#54AFFF", outline="#0070D1", width=2, tags=("player", "marker")
             )
 
         # Salida
@@ -220,69 +475,163 @@ class MazeView:
             sy_center = sy * self.cell_size + self.margin + self.cell_size // 2
             x_start = sx * self.cell_size + self.margin + self.cell_size - 5
             x_end = sx * self.cell_size + self.margin + self.cell_size + 10
-            self.canvas.create_line(x_start, sy_center, x_end, sy_center, fill="red", width=3, arrow="last")
+            self.canvas.create_line(x_start, sy_center, x_end, sy_center, fill="red", width=3, arrow="last",
+                                    tags="marker")
 
-    def draw_visited_nodes(self, visited, exclude_path=None):
+    def draw_path_animated(self, path, visited=None, color="#057032", duration_ms=None,
+                           details=""):
         """
-        Dibuja los nodos visitados durante la búsqueda.
-        Args:
-            visited: conjunto de nodos visitados
-            exclude_path: conjunto de nodos que están en el camino final (para no pintarlos)
+        Dibuja los nodos visitados y luego el camino como una línea que crece.
+
+        La animación avanza por cuadros con presupuesto de tiempo (ver
+        ``FrameAnimator``) y dura aproximadamente ``duration_ms``; por
+        defecto, ``self.animation_duration_ms``.
         """
-        if exclude_path is None:
-            exclude_path = set()
-
-        for node in visited:
-            if node not in exclude_path:
-                x = node[0] * self.cell_size + self.margin + self.cell_size // 2
-                y = node[1] * self.cell_size + self.margin + self.cell_size // 2
-                radius = 3
-                self.canvas.create_oval(
-                    x - radius, y - radius,
-                    x + radius, y + radius,
-                    fill="#FFD700", outline="", tags="visited"
-                )
+        if duration_ms is None:
+            duration_ms = self.animation_duration_ms
 
-    def draw_path_animated(self, path, delay, visited=None, color="#057032"):
-        """Dibuja el camino como una línea animada que crece paso a paso."""
+        path_set = set(path)
+        pending = [node for node in visited if node not in path_set] if visited else []
+        half = self.cell_size // 2
+        radius = 3
 
-        # Primero dibujar nodos visitados si están disponibles
-        if visited:
-            path_set = set(path)
-            self.draw_visited_nodes(visited, exclude_path=path_set)
+        def center(node):
+            return (node[0] * self.cell_size + self.margin + half,
+                    node[1] * self.cell_size + self.margin + half)
 
         def draw_step(index):
-            if index == 0:
-                draw_step(index + 1)
-                return
-
-            if index >= len(path):
-                self.update_info(
-                    f"Camino encontrado: {len(path) - 1} pasos | "
-                    f"Nodos explorados: {len(visited) - 1 if visited else '?'}"
+            if index < len(pending):
+                x, y = center(pending[index])
+                self.canvas.create_oval(
+                    x - radius, y - radius,
+                    x + radius, y + radius,
+                    fill="#FFD700", outline="", tags="visited"
                 )
                 return
 
-            x1, y1 = path[index - 1]
-            x2, y2 = path[index]
-
-            x1 = x1 * self.cell_size + self.margin + self.cell_size // 2
-            y1 = y1 * self.cell_size + self.margin + self.cell_size // 2
-            x2 = x2 * self.cell_size + self.margin + self.cell_size // 2
-            y2 = y2 * self.cell_size + self.margin + self.cell_size // 2
-
-            if index == 1:
-                # Calcular el punto medio entre el nodo 0 y el nodo 1
-                x1 = (x1 + x2) / 2
-                y1 = (y1 + y2) / 2
+            self._draw_segment(path, index - len(pending) + 1, color)
+
+        def finish():
+            self.update_info(self._solution_message(path, visited, details))
+
+        steps = len(pending) + max(0, len(path) - 1)
+        self.animator.play(steps, draw_step, duration_ms=duration_ms, on_done=finish)
+
+    def _draw_segment(self, path, step, color):
+        """Dibuja el tramo del camino entre ``path[step - 1]`` y ``path[step]``."""
+        half = self.cell_size // 2
+        a, b = path[step - 1], path[step]
+        x1 = a[0] * self.cell_size + self.margin + half
+        y1 = a[1] * self.cell_size + self.margin + half
+        x2 = b[0] * self.cell_size + self.margin + half
+        y2 = b[1] * self.cell_size + self.margin + half
+        if step == 1:
+            # Calcular el punto medio entre el nodo 0 y el nodo 1
+            x1 = (x1 + x2) / 2
+            y1 = (y1 + y2) / 2
+        self.canvas.create_line(x1, y1, x2, y2, fill=color, width=6,
+                                tags=("path", _segment_tag(a, b)))
+
+    def update_path(self, graph, old_path, new_path, color="#057032"):
+        """
+        Reemplaza el camino dibujado tras editar paredes.
 
-            self.canvas.create_line(x1, y1, x2, y2, fill=color, width=6, tags="path")
-            self.root.after(delay, lambda: draw_step(index + 1))
+        En modo vectorial solo se borran los tramos que dejaron de estar en
+        el camino y se dibujan los nuevos; el visor por teselas reconstruye
+        únicamente las teselas tocadas y el modo raster vuelve a rasterizar.
+        """
+        old_edges = {_segment_tag(a, b) for a, b in zip(old_path, old_path[1:])}
+        new_edges = {_segment_tag(a, b) for a, b in zip(new_path, new_path[1:])}
+        changed = [node for path in (old_path, new_path) for a, b in zip(path, path[1:])
+                   if _segment_tag(a, b) not in old_edges & new_edges for node in (a, b)]
+
+        if self.viewport.enabled:
+            self.viewport.replace_path(new_path, color, changed)
+            return
+        if self.uses_raster(graph):
+            self.draw_maze_raster(graph, path=new_path, visited=self._raster_overlay[1],
+                                  color=color)
+            return
+
+        # Una animación a medio camino dejaría tramos sin dibujar
+        self.cancel_animation()
+        for tag in old_edges - new_edges:
+            self.canvas.delete(tag)
+        for step in range(1, len(new_path)):
+            if not self.canvas.find_withtag(_segment_tag(new_path[step - 1], new_path[step])):
+                self._draw_segment(new_path, step, color)
+        self.canvas.tag_raise("marker")
+
+    def draw_wall_edit(self, graph, node1, node2, opened):
+        """
+        Refleja en el canvas una pared derribada (``opened``) o levantada.
 
-        draw_step(0)
+        En modo vectorial se agrega un único ítem por pared editada (una
+        línea del color de la pared o del fondo); editarla de nuevo lo borra
+        y vuelve a verse el tramo original.
+        """
+        if self.viewport.enabled:
+            self.viewport.invalidate([node1, node2])
+            return
+        if self.uses_raster(graph):
+            self.draw_maze_raster(graph, *self._raster_overlay)
+            return
+
+        tag = "edit_" + _segment_tag(node1, node2)
+        if self.canvas.find_withtag(tag):
+            self.canvas.delete(tag)
+            return
+
+        (x1, y1), (x2, y2) = sorted((node1, node2))
+        size, margin = self.cell_size, self.margin
+        if x1 != x2:
+            # Pared vertical a la derecha de (x1, y1)
+            coords = [x2 * size + margin, y1 * size + margin,
+                      x2 * size + margin, (y1 + 1) * size + margin]
+            along = (1, 3)
+        else:
+            # Pared horizontal debajo de (x1, y1)
+            coords = [x1 * size + margin, y2 * size + margin,
+                      (x1 + 1) * size + margin, y2 * size + margin]
+            along = (0, 2)
+
+        if opened:
+            # Sin tocar las esquinas, que pertenecen también a otras paredes
+            coords[along[0]] += 1
+            coords[along[1]] -= 1
+            costs = getattr(graph, "costs", None)
+            fill = (terrain_shade(costs[y1 * graph.width + x1]) if costs is not None
+                    else "#1e1e1e")
+        else:
+            fill = "#cccccc"
+        self.canvas.create_line(*coords, width=2, fill=fill, tags=(tag, "wall_edit"))
+        self.canvas.tag_raise("path")
+        self.canvas.tag_raise("marker")
+
+    def _on_right_click(self, event):
+        """Edita la pared más cercana al puntero (solo en la vista de laberinto)."""
+        graph = self.controller.graph
+        if graph is None or self.mode != "maze":
+            return
+        size = self.cell_size
+        px = (self.canvas.canvasx(event.x) - self.margin) / size
+        py = (self.canvas.canvasy(event.y) - self.margin) / size
+        x, y = floor(px), floor(py)
+        fx, fy = px - x, py - y
+        # Lado de la celda más cercano: izquierda, derecha, arriba o abajo
+        _, dx, dy = min((fx, -1, 0), (1 - fx, 1, 0), (fy, 0, -1), (1 - fy, 0, 1))
+        neighbor = (x + dx, y + dy)
+        if all(0 <= cx < graph.width and 0 <= cy < graph.height for cx, cy in ((x, y), neighbor)):
+            self.controller.toggle_wall((x, y), neighbor)
 
     def draw_graph(self, graph):
         """Dibuja el grafo del laberinto con nodos y aristas."""
+        if self.solution_is_static(graph):
+            # Un ítem por nodo y arista no escala: se muestra el laberinto
+            self.draw_maze(graph)
+            return
+
+        self.cancel_animation()
         self.canvas.delete("all")
         node_radius = 5
         link_color = "#CFCFCF"
@@ -330,3 +679,9 @@ class MazeView:
             self.mode = "maze"
             self.draw_maze(self.controller.graph)
             self.update_info("Vista de Laberinto - Listo para resolver")
+
+
+def _segment_tag(a, b):
+    """Tag de canvas de un tramo entre dos celdas (igual en ambos sentidos)."""
+    (x1, y1), (x2, y2) = sorted((a, b))
+    return f"seg_{x1}_{y1}_{x2}_{y2}"
@@ -0,0 +1,201 @@
+import struct
+import zlib
+from functools import lru_cache
+from itertools import chain
+
+import numpy as np
+
+from model.graph import EAST, SOUTH, GridGraph
+
+BACKGROUND = "#1e1e1e"
+WALL_COLOR = "#cccccc"
+VISITED_COLOR = "#FFD700"
+PATH_COLOR = "#057032"
+ENTRY_COLOR = "#54AFFF"
+EXIT_COLOR = "#FF0000"
+# Color del terreno más costoso; el de costo 1 coincide con el fondo
+TERRAIN_COLOR = "#5A3E1B"
+TERRAIN_MAX_COST = 9
+
+
+def _rgb(color):
+    """Convierte ``#rrggbb`` en una tupla RGB."""
+    color = color.lstrip("#")
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def terrain_shade(cost, max_cost=TERRAIN_MAX_COST):
+    """Color ``#rrggbb`` de una celda de costo ``cost`` (interpolado desde el fondo)."""
+    t = (min(cost, max_cost) - 1) / max(1, max_cost - 1)
+    low, high = _rgb(BACKGROUND), _rgb(TERRAIN_COLOR)
+    return "#" + "".join(f"{round(a + (b - a) * t):02x}" for a, b in zip(low, high))
+
+
+@lru_cache(maxsize=None)
+def _terrain_palette(max_cost=TERRAIN_MAX_COST):
+    """
+    Tabla ``(256, 3)`` de colores por costo para indexar con NumPy.
+
+    Se calcula una vez por ``max_cost``; no debe modificarse.
+    """
+    return np.array([_rgb(terrain_shade(max(1, cost), max_cost)) for cost in range(256)],
+                    dtype=np.uint8)
+
+
+def passage_grid(graph):
+    """Retorna la máscara de pasajes como arreglo ``(alto, ancho)`` de uint8."""
+    if not isinstance(graph, GridGraph):
+        if hasattr(graph, "to_grid_graph"):
+            graph = graph.to_grid_graph()
+        else:
+            graph = GridGraph.from_graph(graph)
+    return np.frombuffer(graph.passages, dtype=np.uint8).reshape(graph.height, graph.width)
+
+
+def _cell_mask(nodes, x0, y0, width, height, full_width):
+    """
+    Convierte las celdas dentro de la región en una máscara booleana.
+
+    ``nodes`` es un arreglo NumPy de índices planos (``y * full_width + x``)
+    o una colección de tuplas ``(x, y)``. Las tuplas se aplanan con
+    ``np.fromiter`` sin armar un arreglo intermedio de objetos.
+    """
+    mask = np.zeros((height, width), dtype=bool)
+    if isinstance(nodes, np.ndarray):
+        ys, xs = np.divmod(nodes.astype(np.int64, copy=False), full_width)
+    elif nodes:
+        coords = np.fromiter(chain.from_iterable(nodes), dtype=np.int64, count=2 * len(nodes))
+        xs, ys = coords[0::2], coords[1::2]
+    else:
+        return mask
+    xs = xs - x0
+    ys = ys - y0
+    inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+    mask[ys[inside], xs[inside]] = True
+    return mask
+
+
+def _horizontal_walls(passages, y0, y1, x0, x1):
+    """Paredes de las líneas horizontales ``y0..y1`` para las columnas ``[x0, x1)``."""
+    full_height = passages.shape[0]
+    walls = np.ones((y1 - y0 + 1, x1 - x0), dtype=bool)
+    low, high = max(y0, 1), min(y1, full_height - 1)
+    if low <= high:
+        walls[low - y0:high - y0 + 1] = (passages[low - 1:high, x0:x1] & SOUTH) == 0
+    return walls
+
+
+def _vertical_walls(passages, y0, y1, x0, x1):
+    """Paredes de las líneas verticales ``x0..x1`` para las filas ``[y0, y1)``."""
+    full_width = passages.shape[1]
+    walls = np.ones((y1 - y0, x1 - x0 + 1), dtype=bool)
+    low, high = max(x0, 1), min(x1, full_width - 1)
+    if low <= high:
+        walls[:, low - x0:high - x0 + 1] = (passages[y0:y1, low - 1:high] & EAST) == 0
+    return walls
+
+
+def render_maze(graph, cell_px=4, path=None, visited=None, path_color=PATH_COLOR, region=None):
+    """
+    Rasteriza el laberinto en un búfer de píxeles RGB.
+
+    Terreno, paredes, celdas visitadas y camino se pintan con operaciones vectorizadas,
+    así que el costo depende del tamaño en píxeles y no de la cantidad de
+    paredes. ``region = (x0, y0, x1, y1)`` limita el dibujo a un rectángulo
+    de celdas (por ejemplo, una tesela del visor). Retorna un arreglo
+    ``(alto_px, ancho_px, 3)`` de uint8; el laberinto completo mide
+    ``height * cell_px + 1`` píxeles de alto y las teselas encajan sin solaparse.
+    ``path`` y ``visited`` pueden ser tuplas ``(x, y)`` o un arreglo NumPy de
+    índices planos, que evita convertir tuplas en búsquedas enormes.
+    """
+    full_width, full_height = graph.width, graph.height
+    x0, y0, x1, y1 = region if region is not None else (0, 0, full_width, full_height)
+    x1 = min(x1, full_width)
+    y1 = min(y1, full_height)
+    width, height = x1 - x0, y1 - y0
+    c = cell_px
+    passages = passage_grid(graph)
+
+    image = np.empty((height * c + 1, width * c + 1, 3), dtype=np.uint8)
+    image[:] = _rgb(BACKGROUND)
+    interior = image[:height * c, :width * c]
+
+    costs = getattr(graph, "costs", None)
+    if costs is not None:
+        grid = np.frombuffer(costs, dtype=np.uint8).reshape(full_height, full_width)
+        shades = _terrain_palette()[grid[y0:y1, x0:x1]]
+        interior[:] = np.repeat(np.repeat(shades, c, axis=0), c, axis=1)
+
+    def fill_cells(nodes, color):
+        mask = _cell_mask(nodes, x0, y0, width, height, full_width)
+        if mask.any():
+            interior[np.repeat(np.repeat(mask, c, axis=0), c, axis=1)] = _rgb(color)
+
+    if visited is not None and len(visited):
+        fill_cells(visited, VISITED_COLOR)
+    if path is not None and len(path):
+        fill_cells(path, path_color)
+    if graph.entry:
+        fill_cells([graph.entry], ENTRY_COLOR)
+    if graph.exit:
+        fill_cells([graph.exit], EXIT_COLOR)
+
+    wall = _rgb(WALL_COLOR)
+
+    # Paredes horizontales: línea superior de cada fila de la región más la
+    # inferior. Cada tramo ocupa cell_px + 1 píxeles para cerrar las esquinas.
+    horizontal = _horizontal_walls(passages, y0, y1, x0, x1)
+    image[::c, :width * c][np.repeat(horizontal, c, axis=1)] = wall
+    image[::c, c::c][horizontal] = wall
+
+    # Paredes verticales: línea izquierda de cada columna más la derecha
+    vertical = _vertical_walls(passages, y0, y1, x0, x1)
+    image[:height * c, ::c][np.repeat(vertical, c, axis=0)] = wall
+    image[c::c, ::c][vertical] = wall
+
+    # En una región, las esquinas izquierda y superior también dependen de las
+    # paredes de las celdas vecinas que quedan fuera; así las teselas encajan.
+    if x0 > 0:
+        image[::c, 0][_horizontal_walls(passages, y0, y1, x0 - 1, x0)[:, 0]] = wall
+    if y0 > 0:
+        image[0, ::c][_vertical_walls(passages, y0 - 1, y0, x0, x1)[0]] = wall
+
+    # Abertura de la salida en el borde derecho
+    if graph.exit and graph.exit[0] == full_width - 1 and x1 == full_width:
+        y = graph.exit[1] - y0
+        if 0 <= y < height:
+            image[y * c + 1:(y + 1) * c, width * c] = _rgb(BACKGROUND)
+
+    # La última fila y columna de píxeles pertenecen a la tesela siguiente,
+    # salvo en el borde del laberinto.
+    return image[:height * c + (y1 == full_height), :width * c + (x1 == full_width)]
+
+
+def to_ppm(image):
+    """Codifica el búfer como PPM binario (P6)."""
+    height, width = image.shape[:2]
+    return b"P6 %d %d 255\n" % (width, height) + np.ascontiguousarray(image).tobytes()
+
+
+def to_photo_image(image, master=None):
+    """Crea un ``tkinter.PhotoImage`` con el búfer (sin archivos intermedios)."""
+    import tkinter
+
+    return tkinter.PhotoImage(master=master, data=to_ppm(image), format="PPM")
+
+
+def save_png(image, path):
+    """Guarda el búfer como PNG RGB de 8 bits sin dependencias externas."""
+    height, width = image.shape[:2]
+    rows = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    rows[:, 1:] = image.reshape(height, width * 3)
+
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    with open(path, "wb") as file:
+        file.write(b"\x89PNG\r\n\x1a\n")
+        file.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        file.write(chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)))
+        file.write(chunk(b"IEND", b""))
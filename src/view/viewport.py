@@ -0,0 +1,252 @@
+from collections import OrderedDict
+
+from view.geometry import cost_runs, wall_runs
+from view.raster import render_maze, terrain_shade, to_photo_image
+
+# Tamaño aproximado de una tesela en píxeles
+TILE_PX = 256
+# Por debajo de este tamaño de celda las teselas se rasterizan en vez de
+# dibujarse con líneas: con celdas tan chicas habría demasiados ítems.
+VECTOR_MIN_CELL = 6
+MIN_CELL_SIZE = 1
+MAX_CELL_SIZE = 60
+
+
+class TiledViewport:
+    """
+    Visor con scroll y zoom que solo dibuja las teselas visibles.
+
+    El laberinto se divide en teselas de ``tile_cells`` x ``tile_cells``
+    celdas. Al desplazarse se construyen perezosamente las teselas que
+    entran en pantalla (líneas fusionadas o un bitmap, según el zoom) y se
+    descartan las menos usadas cuando se supera ``max_tiles``.
+    """
+
+    def __init__(self, view, max_tiles=200):
+        """Se engancha al canvas de la vista."""
+        self.view = view
+        self.canvas = view.canvas
+        self.max_tiles = max_tiles
+        self.enabled = False
+        self.graph = None
+        self.tile_cells = 32
+        self.tiles = OrderedDict()
+        self.overlay = None
+        self._pending = None
+
+        self.canvas.bind("<Configure>", lambda event: self.schedule_refresh())
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Button-4>", self._on_wheel)
+        self.canvas.bind("<Button-5>", self._on_wheel)
+        self.canvas.bind("<ButtonPress-1>", self._on_press)
+        self.canvas.bind("<B1-Motion>", self._on_drag)
+
+    # --- estado ---
+
+    def attach(self, graph):
+        """Empieza a mostrar ``graph`` desde cero."""
+        self.graph = graph
+        self.overlay = None
+        self.reset()
+
+    def reset(self):
+        """Descarta todas las teselas (por ejemplo, tras un zoom)."""
+        self.canvas.delete("tile")
+        self.tiles.clear()
+        self.tile_cells = max(4, TILE_PX // self.view.cell_size)
+        self.schedule_refresh()
+
+    def set_overlay(self, path, visited, color):
+        """Agrega camino y visitados; se dibujan tesela por tesela."""
+        self.tile_cells = max(4, TILE_PX // self.view.cell_size)
+        path_by_tile = {}
+        for index, node in enumerate(path):
+            path_by_tile.setdefault(self._tile_of(node), []).append(index)
+        visited_by_tile = {}
+        for node in visited:
+            visited_by_tile.setdefault(self._tile_of(node), []).append(node)
+        self.overlay = {
+            "path": path,
+            "visited": visited,
+            "color": color,
+            "path_by_tile": path_by_tile,
+            "visited_by_tile": visited_by_tile,
+        }
+        self.reset()
+
+    def replace_path(self, path, color, changed):
+        """
+        Cambia el camino del overlay tras editar paredes.
+
+        Solo se descartan (y se reconstruyen al refrescar) las teselas de las
+        celdas en ``changed``; los visitados de la búsqueda original se
+        conservan.
+        """
+        if self.overlay is None:
+            self.set_overlay(path, [], color)
+            return
+        path_by_tile = {}
+        for index, node in enumerate(path):
+            path_by_tile.setdefault(self._tile_of(node), []).append(index)
+        self.overlay.update(path=path, color=color, path_by_tile=path_by_tile)
+        self.invalidate(changed)
+
+    def invalidate(self, nodes):
+        """Descarta las teselas que contienen ``nodes`` para redibujarlas."""
+        for key in {self._tile_of(node) for node in nodes}:
+            self.tiles.pop(key, None)
+            self.canvas.delete(f"tile_{key[0]}_{key[1]}")
+        self.schedule_refresh()
+
+    def _tile_of(self, node):
+        return node[0] // self.tile_cells, node[1] // self.tile_cells
+
+    # --- dibujo ---
+
+    def schedule_refresh(self):
+        """Agrupa varios eventos de scroll en un único refresco."""
+        if self.enabled and self._pending is None:
+            self._pending = self.canvas.after_idle(self.refresh)
+
+    def visible_tiles(self):
+        """Teselas que intersectan la porción visible del canvas."""
+        size = self.view.cell_size
+        margin = self.view.margin
+        span = self.tile_cells * size
+        left = self.canvas.canvasx(0) - margin
+        top = self.canvas.canvasy(0) - margin
+        right = left + self.canvas.winfo_width()
+        bottom = top + self.canvas.winfo_height()
+
+        columns = -(-self.graph.width // self.tile_cells)
+        rows = -(-self.graph.height // self.tile_cells)
+        tx0, tx1 = max(0, int(left // span)), min(columns - 1, int(right // span))
+        ty0, ty1 = max(0, int(top // span)), min(rows - 1, int(bottom // span))
+        return [(tx, ty) for ty in range(ty0, ty1 + 1) for tx in range(tx0, tx1 + 1)]
+
+    def refresh(self):
+        """Construye las teselas visibles que faltan y descarta las viejas."""
+        self._pending = None
+        if not self.enabled or self.graph is None:
+            return
+
+        visible = self.visible_tiles()
+        for key in visible:
+            if key in self.tiles:
+                self.tiles.move_to_end(key)
+            else:
+                self.tiles[key] = self._build_tile(*key)
+
+        limit = max(self.max_tiles, len(visible))
+        while len(self.tiles) > limit:
+            key, _ = self.tiles.popitem(last=False)
+            self.canvas.delete(f"tile_{key[0]}_{key[1]}")
+
+        self.canvas.tag_raise("path")
+        self.canvas.tag_raise("marker")
+
+    def _build_tile(self, tx, ty):
+        """Dibuja una tesela; retorna su ``PhotoImage`` (o ``None`` si es vectorial)."""
+        graph = self.graph
+        size = self.view.cell_size
+        margin = self.view.margin
+        cells = self.tile_cells
+        x0, y0 = tx * cells, ty * cells
+        x1, y1 = min(x0 + cells, graph.width), min(y0 + cells, graph.height)
+        tags = ("tile", f"tile_{tx}_{ty}")
+        overlay = self.overlay or {}
+        path = overlay.get("path", [])
+        path_indices = overlay.get("path_by_tile", {}).get((tx, ty), [])
+        visited = overlay.get("visited_by_tile", {}).get((tx, ty), [])
+        color = overlay.get("color", "#057032")
+
+        if size < VECTOR_MIN_CELL:
+            image = render_maze(graph, size, path=[path[i] for i in path_indices],
+                                visited=visited, path_color=color, region=(x0, y0, x1, y1))
+            photo = to_photo_image(image, master=self.canvas)
+            self.canvas.create_image(x0 * size + margin, y0 * size + margin,
+                                     anchor="nw", image=photo, tags=tags)
+            return photo
+
+        for y, x_start, x_end, cost in cost_runs(graph, x0, y0, x1, y1):
+            self.canvas.create_rectangle(x_start * size + margin, y * size + margin,
+                                         x_end * size + margin, (y + 1) * size + margin,
+                                         fill=terrain_shade(cost), outline="", tags=tags)
+
+        horizontal, vertical = wall_runs(graph, x0, y0, x1, y1)
+        for y, x_start, x_end in horizontal:
+            py = y * size + margin
+            self.canvas.create_line(x_start * size + margin, py, x_end * size + margin, py,
+                                    width=2, fill="#cccccc", tags=tags)
+        for x, y_start, y_end in vertical:
+            px = x * size + margin
+            self.canvas.create_line(px, y_start * size + margin, px, y_end * size + margin,
+                                    width=2, fill="#cccccc", tags=tags)
+
+        half = size // 2
+        radius = max(1, size // 8)
+        for x, y in visited:
+            cx, cy = x * size + margin + half, y * size + margin + half
+            self.canvas.create_oval(cx - radius, cy - radius, cx + radius, cy + radius,
+                                    fill="#FFD700", outline="", tags=tags)
+        for index in path_indices:
+            if index + 1 < len(path):
+                (ax, ay), (bx, by) = path[index], path[index + 1]
+                self.canvas.create_line(ax * size + margin + half, ay * size + margin + half,
+                                        bx * size + margin + half, by * size + margin + half,
+                                        fill=color, width=max(2, size // 4),
+                                        tags=tags + ("path",))
+        return None
+
+    # --- navegación ---
+
+    def _on_wheel(self, event):
+        if not self.enabled or self.graph is None:
+            return
+        if event.num == 4 or event.delta > 0:
+            direction = -1
+        else:
+            direction = 1
+
+        if event.state & 0x0004:  # Control: zoom centrado en el puntero
+            self.zoom(1.25 if direction < 0 else 0.8, event.x, event.y)
+        elif event.state & 0x0001:  # Shift: desplazamiento horizontal
+            self.canvas.xview_scroll(direction * 3, "units")
+        else:
+            self.canvas.yview_scroll(direction * 3, "units")
+        self.schedule_refresh()
+
+    def _on_press(self, event):
+        if self.enabled:
+            self.canvas.scan_mark(event.x, event.y)
+
+    def _on_drag(self, event):
+        if self.enabled:
+            self.canvas.scan_dragto(event.x, event.y, gain=1)
+            self.schedule_refresh()
+
+    def zoom(self, factor, x, y):
+        """Cambia ``cell_size`` manteniendo fija la celda bajo el punto (x, y)."""
+        view = self.view
+        old = view.cell_size
+        new = int(round(old * factor))
+        if new == old:
+            new = old + (1 if factor > 1 else -1)
+        new = max(MIN_CELL_SIZE, min(MAX_CELL_SIZE, new))
+        if new == old:
+            return
+
+        cell_x = (self.canvas.canvasx(x) - view.margin) / old
+        cell_y = (self.canvas.canvasy(y) - view.margin) / old
+        view.cell_size = new
+        total_width, total_height = view.update_scrollregion(self.graph)
+
+        self.canvas.xview_moveto(max(0.0, (cell_x * new + view.margin - x) / total_width))
+        self.canvas.yview_moveto(max(0.0, (cell_y * new + view.margin - y) / total_height))
+
+        if self.overlay:
+            self.set_overlay(self.overlay["path"], self.overlay["visited"], self.overlay["color"])
+        else:
+            self.reset()
+        view.draw_markers(self.graph)
+        view.update_info(f"Zoom: {new} px por celda")